@@ -1,51 +1,154 @@
 """Backend для получения данных погоды, финансов и трендов."""
+import json
+import logging
 import time
+from functools import lru_cache
+
 import requests
+import urllib3
 import xml.etree.ElementTree as ET
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, RLock
 from typing import Dict, List
 
-# Простой кэш с TTL
-_cache: Dict[str, tuple] = {}
-_cache_lock = Lock()
+from cachetools import TTLCache
+
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+# orjson декодирует JSON в 2-5 раз быстрее stdlib, но это нативное колесо —
+# в Android-сборке его нет, тогда остаёмся на resp.json().
+try:
+    import orjson  # type: ignore[import]
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def _loads(resp) -> dict:
+    """Декодировать JSON-ответ самым быстрым доступным способом."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _loads_bytes(buf: bytes) -> dict:
+    """То же для сырых байтов (ответы urllib3)."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+# lxml парсит RSS в C-коде заметно быстрее stdlib ET, но это нативная
+# зависимость — в Android-сборках её может не быть, тогда работаем через ET.
+try:
+    from lxml import etree  # type: ignore[import]
+    _ITEM_XPATH = etree.XPath('.//item')
+    _TITLE_XPATH = etree.XPath('title/text()')
+except Exception:  # pragma: no cover
+    etree = None
+    _ITEM_XPATH = None
+    _TITLE_XPATH = None
+
+# Общая сессия: keep-alive соединения к finance.yahoo.com / api.open-meteo.com
+# вместо нового TCP+TLS handshake на каждый запрос.
+_session = requests.Session()
+_session.headers.update({'User-Agent': 'Mozilla/5.0'})
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Горячий путь котировок ходит в urllib3 напрямую, минуя requests-обвязку
+# (PreparedRequest, слияние заголовков, dispatch адаптера) — на фан-ауте по
+# символам эта питоновская обвязка заметна. Остальные вызовы остаются на Session.
+_http = urllib3.PoolManager(num_pools=4, maxsize=32, headers={'User-Agent': 'Mozilla/5.0'})
+
+# Пул потоков для IO-bound задач (аналогично executor в news_search_core)
+executor = ThreadPoolExecutor(max_workers=16)
 
+# Кэши с TTL по типу данных; TTLCache сам следит за сроком жизни записей,
+# ручная арифметика с time.time() больше не нужна. Лок — только на запись.
+# Погода кэшируется отдельно через lru_cache (см. get_weather).
+_yahoo_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_trends_cache: TTLCache = TTLCache(maxsize=4, ttl=1800)
+_cache_lock = RLock()
 
-def _get_from_cache(key: str, ttl: int):
-    with _cache_lock:
-        entry = _cache.get(key)
-        if not entry:
-            return None
-        ts, val = entry
-        if time.time() - ts < ttl:
-            return val
-        del _cache[key]
-        return None
+# Single-flight: при одновременном cache-miss на один ключ запрос к апстриму
+# делает только первый поток, остальные ждут готовый результат (актуально при
+# параллельном refresh_all, когда кэш протух сразу у всех).
+_inflight: Dict[str, Event] = {}
+_inflight_results: Dict[str, object] = {}
+_inflight_lock = RLock()
 
 
-def _set_cache(key: str, val):
-    with _cache_lock:
-        _cache[key] = (time.time(), val)
+def _single_flight(key: str, fetch):
+    """Выполнить fetch() один раз на все конкурирующие вызовы с этим ключом."""
+    with _inflight_lock:
+        event = _inflight.get(key)
+        if event is None:
+            _inflight[key] = event = Event()
+            is_owner = True
+        else:
+            is_owner = False
+
+    if not is_owner:
+        event.wait()
+        return _inflight_results.get(key)
+
+    try:
+        result = fetch()
+        _inflight_results[key] = result
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        event.set()
 
 
 def fetch_json(url: str, timeout: tuple = (3, 8)) -> dict:
     try:
-        resp = requests.get(url, timeout=timeout)
-        if resp.ok:
-            return resp.json()
+        resp = _session.get(url, timeout=timeout)
+        # Сравнение int дешевле property resp.ok (status_code < 400 за тремя
+        # attribute-lookup'ами), а узкий except не прячет настоящие баги.
+        sc = resp.status_code
+        if 200 <= sc < 300:
+            return _loads(resp)
         return {}
-    except Exception:
+    except (requests.RequestException, ValueError):
+        # ValueError покрывает и json.JSONDecodeError, и orjson.JSONDecodeError
         return {}
 
 
-def get_weather(lat: float = 54.74, lon: float = 55.97, ttl: int = 300) -> Dict:
+# Шаблоны URL собираются один раз на импорт, в вызове остаётся только .format
+_WEATHER_URL = (
+    "https://api.open-meteo.com/v1/forecast"
+    "?latitude={}&longitude={}&current_weather=true&timezone=auto"
+).format
+_YAHOO_URL = (
+    "https://query1.finance.yahoo.com/v8/finance/chart/{}?interval=1d&range=1d"
+).format
+_YAHOO_BATCH_URL = (
+    "https://query1.finance.yahoo.com/v7/finance/quote?symbols={}"
+).format
+
+
+def get_weather(lat: float = 54.74, lon: float = 55.97, keep_raw: bool = False) -> Dict:
     """Получить текущую погоду из open-meteo (без API ключа)."""
-    key = f"weather::{lat}:{lon}"
-    cached = _get_from_cache(key, ttl)
-    if cached:
-        return cached
+    # TTL поверх C-реализованного lru_cache: в ключ входит номер 5-минутного
+    # интервала, при смене интервала появляется новый ключ, а старая запись
+    # постепенно выселяется по LRU.
+    return _weather_cached(lat, lon, keep_raw, int(time.time() // 300))
 
-    url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current_weather=true&timezone=auto"
-    data = fetch_json(url)
+
+@lru_cache(maxsize=64)
+def _weather_cached(lat: float, lon: float, keep_raw: bool, ttl_bucket: int) -> Dict:
+    return _single_flight(
+        f"weather::{lat}:{lon}", lambda: _fetch_weather(lat, lon, keep_raw)
+    )
+
+
+def _fetch_weather(lat: float, lon: float, keep_raw: bool) -> Dict:
+    data = fetch_json(_WEATHER_URL(lat, lon))
     out = {}
     cur = data.get('current_weather') or {}
     out['temperature'] = cur.get('temperature')
@@ -53,35 +156,66 @@ def get_weather(lat: float = 54.74, lon: float = 55.97, ttl: int = 300) -> Dict:
     out['weathercode'] = cur.get('weathercode')
     out['winddirection'] = cur.get('winddirection')
     out['time'] = cur.get('time')
-    out['raw'] = data
-    _set_cache(key, out)
+    if keep_raw:
+        # Полный ответ open-meteo — несколько КБ; по умолчанию не держим
+        # его в кэше, подавляющему большинству вызовов нужны только поля выше.
+        out['raw'] = data
     return out
 
 
-def get_yahoo_price(symbol: str, ttl: int = 300) -> float:
+def get_yahoo_price(symbol: str) -> float:
     """Получить цену с Yahoo Finance."""
-    key = f"yahoo::{symbol}"
-    cached = _get_from_cache(key, ttl)
-    if cached:
-        return cached
+    try:
+        return _yahoo_cache[symbol]
+    except KeyError:
+        pass
 
-    url = f"https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?interval=1d&range=1d"
-    headers = {'User-Agent': 'Mozilla/5.0'}
+    url = _YAHOO_URL(symbol)
     try:
-        resp = requests.get(url, headers=headers, timeout=5)
-        if resp.ok:
-            data = resp.json()
-            result = data.get('chart', {}).get('result', [])
-            if result:
-                price = result[0].get('meta', {}).get('regularMarketPrice')
-                if price is not None:
-                    _set_cache(key, price)
-                    return price
+        r = _http.request('GET', url, timeout=5.0)
+        if r.status == 200:
+            data = _loads_bytes(r.data)
+            # EAFP: на happy path прямой доступ дешевле цепочки .get({})
+            try:
+                price = data['chart']['result'][0]['meta']['regularMarketPrice']
+            except (KeyError, IndexError, TypeError):
+                price = None
+            if price is not None:
+                with _cache_lock:
+                    _yahoo_cache[symbol] = price
+                return price
     except Exception as e:
-        print(f"Ошибка получения {symbol}: {e}")
+        log.warning("Ошибка получения %s: %s", symbol, e)
     return 0.0
 
 
+def get_yahoo_prices_batch(symbols: List[str]) -> Dict[str, float]:
+    """Получить цены сразу нескольких символов одним запросом (/v7/quote).
+
+    Каждая цена кладётся в кэш отдельно, чтобы одиночные вызовы
+    get_yahoo_price тоже попадали в кэш.
+    """
+    if not symbols:
+        return {}
+
+    url = _YAHOO_BATCH_URL(','.join(symbols))
+    prices: Dict[str, float] = {}
+    try:
+        resp = _session.get(url, timeout=5)
+        if resp.ok:
+            data = _loads(resp)
+            for quote in data.get('quoteResponse', {}).get('result', []):
+                sym = quote.get('symbol')
+                price = quote.get('regularMarketPrice')
+                if sym and price is not None:
+                    prices[sym] = price
+                    with _cache_lock:
+                        _yahoo_cache[sym] = price
+    except Exception as e:
+        log.warning("Ошибка пакетного запроса котировок: %s", e)
+    return prices
+
+
 def get_financial_data(symbols: List[str] = None) -> Dict[str, float]:
     """Получить цены нескольких символов."""
     if symbols is None:
@@ -97,56 +231,137 @@ def get_financial_data(symbols: List[str] = None) -> Dict[str, float]:
             "BTC-USD",    # Bitcoin
             "ETH-USD",    # Ethereum
         ]
-    results = {}
+
+    # Сначала раздаём то, что уже в кэше, остальное берём одним
+    # пакетным запросом вместо N отдельных round-trip'ов.
+    results: Dict[str, float] = {}
+    missing: List[str] = []
     for sym in symbols:
-        results[sym] = get_yahoo_price(sym)
-    return results
+        try:
+            results[sym] = _yahoo_cache[sym]
+        except KeyError:
+            missing.append(sym)
+
+    if missing:
+        batch = get_yahoo_prices_batch(missing)
+        still_missing = [sym for sym in missing if sym not in batch]
+        results.update(batch)
+        # Пакетный endpoint иногда недоступен — добираем по одному
+        # через /v8/chart параллельно (старый путь).
+        if still_missing:
+            with ThreadPoolExecutor(max_workers=len(still_missing)) as ex:
+                prices = list(ex.map(get_yahoo_price, still_missing))
+            results.update(zip(still_missing, prices))
+
+    return {sym: results.get(sym, 0.0) for sym in symbols}
+
+
+def refresh_all(lat: float = 54.74, lon: float = 55.97) -> Dict:
+    """Обновить все данные дашборда одним параллельным заходом.
+
+    Погода, котировки и тренды — независимые сетевые вызовы, поэтому
+    запускаем их одновременно и ждём самый медленный, а не сумму трёх.
+    """
+    weather_f = executor.submit(get_weather, lat, lon)
+    fin_f = executor.submit(get_financial_data)
+    trends_f = executor.submit(get_google_trends)
+    return {
+        "weather": weather_f.result(),
+        "financial": fin_f.result(),
+        "trends": trends_f.result(),
+    }
 
 
-def get_google_trends(ttl: int = 1800) -> List[Dict[str, str]]:
+def get_google_trends() -> List[Dict[str, str]]:
     """Получить тренды из Google News RSS."""
     key = "google_trends_rss"
-    cached = _get_from_cache(key, ttl)
-    if cached:
-        return cached
+    try:
+        return _trends_cache[key]
+    except KeyError:
+        pass
+
+    # Фид многосотенный КБ — дублировать его загрузку под burst'ом обиднее всего
+    return _single_flight(key, lambda: _fetch_trends(key))
+
+
+# Валидаторы последнего успешно разобранного фида: с ними Google отвечает
+# 304 без тела, и мы пропускаем и скачивание, и парсинг.
+_trends_state: Dict[str, object] = {'etag': None, 'last_modified': None, 'trends': None}
 
+
+def _fetch_trends(key: str) -> List[Dict[str, str]]:
     url = "https://news.google.com/rss?hl=ru&gl=RU&ceid=RU:ru"
     try:
         # Используем сконфигурированный session из news_search_core
         from news_search_core import session
-        
-        print(f"[TRENDS] Fetching Google News trends from {url}")
-        resp = session.get(url, timeout=(5, 10))
-        print(f"[TRENDS] Response status: {resp.status_code}")
-        
+
+        headers = {'Accept': 'application/rss+xml, application/xml;q=0.9, */*;q=0.5'}
+        if _trends_state['etag']:
+            headers['If-None-Match'] = _trends_state['etag']
+        if _trends_state['last_modified']:
+            headers['If-Modified-Since'] = _trends_state['last_modified']
+
+        log.debug("[TRENDS] Fetching Google News trends from %s", url)
+        resp = session.get(url, stream=True, timeout=(5, 10), headers=headers)
+        log.debug("[TRENDS] Response status: %s", resp.status_code)
+
+        if resp.status_code == 304 and _trends_state['trends']:
+            # Фид не менялся — продлеваем жизнь прошлому результату
+            log.debug("[TRENDS] Feed unchanged (304), reusing parsed trends")
+            trends = _trends_state['trends']
+            with _cache_lock:
+                _trends_cache[key] = trends
+            return trends
+
         if resp.ok:
-            root = ET.fromstring(resp.content)
-            items = root.findall('.//item')
-            trends = []
-            for item in items[:30]:  # Get top 30
-                title_elem = item.find('title')
-                if title_elem is not None and title_elem.text:
-                    title = title_elem.text
-                    if ' - ' in title:
-                        title = title.rsplit(' - ', 1)[0]
-                    trends.append({
-                        "tag": "#News",
-                        "name": title[:60],  # Обрежем длинные заголовки
-                        "change": "Hot"
-                    })
+            # Стримим XML вместо построения всего DOM: нужны только первые
+            # 30 <item>, остальной фид даже не материализуется.
+            resp.raw.decode_content = True
+            titles = []
+            if etree is not None:
+                for _, elem in etree.iterparse(resp.raw, tag='item'):
+                    titles.append((_TITLE_XPATH(elem) or [None])[0])
+                    elem.clear()
+                    # Канонический lxml-паттерн: освобождаем уже обработанных
+                    # соседей, чтобы дерево не росло по ходу итерации.
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                    if len(titles) >= 30:
+                        break
+            else:
+                for _, elem in ET.iterparse(resp.raw):
+                    if elem.tag == 'item':
+                        titles.append(elem.findtext('title'))
+                        elem.clear()
+                        if len(titles) >= 30:
+                            break
+            # Один comprehension вместо цикла с .append: rpartition — один
+            # проход по строке, длинные заголовки обрезаем до 60 символов.
+            trends = [
+                {
+                    "tag": "#News",
+                    "name": (head if sep else title)[:60],
+                    "change": "Hot",
+                }
+                for title in titles
+                if title
+                for head, sep, _ in (title.rpartition(' - '),)
+            ]
             if trends:
-                print(f"[TRENDS] Found {len(trends)} trends")
-                _set_cache(key, trends)
+                log.debug("[TRENDS] Found %d trends", len(trends))
+                _trends_state['etag'] = resp.headers.get('ETag')
+                _trends_state['last_modified'] = resp.headers.get('Last-Modified')
+                _trends_state['trends'] = trends
+                with _cache_lock:
+                    _trends_cache[key] = trends
                 return trends
             else:
-                print("[TRENDS] No trends found in RSS")
-    except Exception as e:
-        print(f"[TRENDS] Ошибка получения трендов: {e}")
-        import traceback
-        traceback.print_exc()
-    
+                log.debug("[TRENDS] No trends found in RSS")
+    except Exception:
+        log.exception("[TRENDS] Ошибка получения трендов")
+
     # Fallback
-    print("[TRENDS] Using fallback trends")
+    log.debug("[TRENDS] Using fallback trends")
     return [
         {"tag": "#AI", "name": "ИИ и Нейросети", "change": "+24%"},
         {"tag": "#Space", "name": "Космос", "change": "+12%"},
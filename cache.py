@@ -0,0 +1,97 @@
+"""Дисковый кэш JSON-ответов с TTL для данных домашнего экрана.
+
+Позволяет отрисовать HomeScreen на тёплом старте без сетевых запросов:
+погода/финансы/тренды читаются из файла, пока не протухли.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+
+log = logging.getLogger(__name__)
+
+# Кэш статей: тексты переживают перезапуск приложения, чтобы повторное
+# открытие не качало и не парсило HTML заново
+_ARTICLE_TTL = 7 * 24 * 3600
+_ARTICLE_MAX_FILES = 200
+
+
+def _cache_dir() -> str:
+    try:
+        from kivy.app import App
+        app = App.get_running_app()
+        if app is not None:
+            return app.user_data_dir
+    except Exception:
+        pass
+    return os.path.join(os.path.expanduser("~"), ".news_app_cache")
+
+
+def _path(key: str) -> str:
+    return os.path.join(_cache_dir(), f"{key}.json")
+
+
+def load(key: str, ttl: float):
+    """Вернуть сохранённый объект, если файл моложе ttl секунд, иначе None."""
+    path = _path(key)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def store(key: str, obj) -> None:
+    """Сохранить объект на диск (ошибки записи не фатальны)."""
+    try:
+        os.makedirs(_cache_dir(), exist_ok=True)
+        with open(_path(key), "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False)
+    except Exception:
+        log.debug("Не удалось сохранить кэш %s", key, exc_info=True)
+
+
+def _article_path(link: str) -> str:
+    digest = hashlib.sha1(link.encode("utf-8")).hexdigest()
+    return os.path.join(_cache_dir(), "articles", f"{digest}.json")
+
+
+def load_article(link: str, ttl: float = _ARTICLE_TTL):
+    """Вернуть сохранённую статью {'full_text', 'image'} для ссылки или None."""
+    path = _article_path(link)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def store_article(link: str, obj) -> None:
+    """Сохранить статью на диск; самые старые файлы вытесняются по лимиту."""
+    articles_dir = os.path.join(_cache_dir(), "articles")
+    try:
+        os.makedirs(articles_dir, exist_ok=True)
+        with open(_article_path(link), "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False)
+        _prune_articles(articles_dir)
+    except Exception:
+        log.debug("Не удалось сохранить статью %s", link[:60], exc_info=True)
+
+
+def _prune_articles(articles_dir: str) -> None:
+    """Удалить самые давние статьи сверх _ARTICLE_MAX_FILES."""
+    entries = [os.path.join(articles_dir, name) for name in os.listdir(articles_dir)]
+    if len(entries) <= _ARTICLE_MAX_FILES:
+        return
+    entries.sort(key=os.path.getmtime)
+    for path in entries[:len(entries) - _ARTICLE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
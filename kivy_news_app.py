@@ -2,22 +2,38 @@
 
 from __future__ import annotations
 
-import threading
 import datetime
+import email.utils as email_utils
+import logging
+import os
+import re
+import sys
+import time
+import webbrowser
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Event
 from functools import partial
 from typing import List, Dict
 
+from kivy.cache import Cache
 from kivy.clock import Clock
+from kivy.core.text import Label as CoreLabel
 from kivy.core.window import Window
-from kivy.metrics import dp
+from kivy.lang import Builder
+from kivy.loader import Loader
+from kivy.metrics import dp, sp
+from kivy.properties import StringProperty
 from kivy.utils import platform
 from kivy.graphics import Line, Color, RoundedRectangle
 from kivy.uix.image import AsyncImage
 from kivy.uix.anchorlayout import AnchorLayout
 from kivy.uix.gridlayout import GridLayout
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
 from kivymd.app import MDApp
 from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.button import MDRaisedButton, MDFlatButton, MDIconButton
+from kivymd.uix.button import MDFlatButton, MDIconButton
 from kivymd.uix.label import MDLabel
 from kivymd.uix.scrollview import MDScrollView
 from kivymd.uix.screen import Screen
@@ -31,117 +47,345 @@ from kivymd.uix.navigationdrawer import MDNavigationLayout, MDNavigationDrawer
 from kivymd.toast import toast
 from kivymd.uix.dialog import MDDialog
 
+import cache
 from news_search_core import get_news_with_content, fetch_article_text, fetch_article_content
-from backend import get_weather, get_financial_data, get_google_trends
+from backend import refresh_all
 from llm_integration import llm_client
 from news_parser_manual import WebViewWidget
 
+# Диагностика горячих путей: print пишет в stderr синхронно (на Android —
+# через logcat) и форматирует строку всегда. Логгер с %s-плейсхолдерами на
+# уровне WARNING не делает ни того, ни другого; отладочный вывод включается
+# переменной окружения NEWS_APP_DEBUG.
+log = logging.getLogger("news_app")
+log.setLevel(logging.DEBUG if os.environ.get("NEWS_APP_DEBUG") else logging.WARNING)
+
+
+# Месяцы для короткого формата даты в карточке ("19 дек 2025")
+_MONTHS_RU_SHORT = {1: "янв", 2: "фев", 3: "мар", 4: "апр", 5: "мая", 6: "июн",
+                    7: "июл", 8: "авг", 9: "сен", 10: "окт", 11: "ноя", 12: "дек"}
+
+# Статические таблицы домашнего экрана — собираются один раз на импорт,
+# а не при каждом построении UI
+_MONTHS_RU = ("", "января", "февраля", "марта", "апреля", "мая", "июня",
+              "июля", "августа", "сентября", "октября", "ноября", "декабря")
+_DAYS_RU = ("Понедельник", "Вторник", "Среда", "Четверг", "Пятница", "Суббота", "Воскресенье")
+
+# weathercode -> (описание, иконка): один dict-lookup вместо каскада тернарников
+_WEATHER_DEFAULT = ("Облачно", "weather-cloudy")
+_WEATHER_BY_CODE = {
+    0: ("Ясно", "weather-sunny"),
+    1: ("Облачно", "weather-cloudy"),
+    2: ("Облачно", "weather-cloudy"),
+    3: ("Облачно", "weather-cloudy"),
+    61: ("Дождь", "weather-rainy"),
+    63: ("Дождь", "weather-rainy"),
+    65: ("Дождь", "weather-rainy"),
+}
+
+# Структура домашнего экрана не меняется между перестроениями,
+# поэтому списки инструментов/категорий и палитра — константы модуля.
+# Полоса «Рынки»: (тикер, подпись, форматтер значения, иконка)
+_RUB_FMT = lambda v: f"{v:.2f} ₽" if v else "—"
+_STOCK_FMT = lambda v: f"${v:.2f}" if v else "—"
+_CRYPTO_FMT = lambda v: f"${int(v):,}" if v else "—"
+_INSTR_SPECS = (
+    ("RUB=X", "USD", _RUB_FMT, "currency-usd"),
+    ("EURRUB=X", "EUR", _RUB_FMT, "currency-eur"),
+    ("NVDA", "NVIDIA", _STOCK_FMT, "chart-line"),
+    ("AAPL", "Apple", _STOCK_FMT, "chart-line"),
+    ("GOOGL", "Google", _STOCK_FMT, "chart-line"),
+    ("MSFT", "Microsoft", _STOCK_FMT, "chart-line"),
+    ("TSLA", "Tesla", _STOCK_FMT, "chart-line"),
+    ("AMZN", "Amazon", _STOCK_FMT, "chart-line"),
+    ("BTC-USD", "Bitcoin", _CRYPTO_FMT, "currency-btc"),
+    ("ETH-USD", "Ethereum", _CRYPTO_FMT, "currency-btc"),
+)
+_CATEGORIES = (
+    ("laptop", "Техно"),
+    ("soccer", "Спорт"),
+    ("briefcase", "Бизнес"),
+    ("atom", "Наука"),
+    ("movie", "Кино"),
+    ("music", "Музыка"),
+)
+_CATEGORY_COLORS = (
+    (0.90, 0.95, 1.0, 1),    # Голубой - Техно
+    (0.95, 1.0, 0.90, 1),    # Зеленый - Спорт
+    (1.0, 0.95, 0.85, 1),    # Оранжевый - Бизнес
+    (0.95, 0.90, 1.0, 1),    # Фиолетовый - Наука
+    (1.0, 0.90, 0.90, 1),    # Розовый - Кино
+    (0.98, 0.98, 0.85, 1),   # Желтый - Музыка
+)
+
+
+# Числовые метрики: Kivy парсит строку вида "14dp" при каждом присваивании
+# свойства, поэтому dp()/sp() считаются один раз на импорт модуля
+_DP0 = dp(0)
+_DP2 = dp(2)
+_DP4 = dp(4)
+_DP6 = dp(6)
+_DP8 = dp(8)
+_DP10 = dp(10)
+_DP12 = dp(12)
+_DP14 = dp(14)
+_DP16 = dp(16)
+_DP20 = dp(20)
+_DP28 = dp(28)
+_DP32 = dp(32)
+_DP36 = dp(36)
+_DP48 = dp(48)
+_DP50 = dp(50)
+_DP52 = dp(52)
+_DP56 = dp(56)
+_DP60 = dp(60)
+_DP64 = dp(64)
+_DP80 = dp(80)
+_DP82 = dp(82)
+_DP96 = dp(96)
+_DP110 = dp(110)
+_DP120 = dp(120)
+_DP130 = dp(130)
+_DP140 = dp(140)
+_DP144 = dp(144)
+_DP180 = dp(180)
+_DP200 = dp(200)
+_DP220 = dp(220)
+_DP260 = dp(260)
+_DP345 = dp(345)
+_SP10 = sp(10)
+_SP13 = sp(13)
+_SP16 = sp(16)
+_SP18 = sp(18)
+_SP20 = sp(20)
+_SP24 = sp(24)
+_SP28 = sp(28)
+_SP32 = sp(32)
+_SP42 = sp(42)
+
+
+class _LRU(OrderedDict):
+    """Dict с вытеснением самых старых записей при превышении cap.
+
+    Полные тексты статей занимают десятки КБ каждая; без ограничения кэш
+    растёт весь сеанс, что критично при жёстких лимитах памяти на Android.
+    """
+
+    def __init__(self, cap: int) -> None:
+        super().__init__()
+        self.cap = cap
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        if len(self) > self.cap:
+            self.popitem(last=False)
+
+
+# Синонимы по одному и тому же запросу не перегенерируем:
+# это лишний LLM-вызов на повторный поиск
+_synonym_cache = _LRU(64)
+
+
+def _bind_texture_height(inst, val):
+    """Общий колбэк bind: высота label по высоте текстуры (без замыканий)."""
+    inst.height = val[1]
+
+
+def _bind_text_wrap(inst, val):
+    """Общий колбэк bind: перенос текста по текущей ширине label."""
+    inst.text_size = (val, None)
+
+
+def _prefetch_images(urls: List[str]) -> None:
+    """Прогреть кэш загрузчика картинок одной пачкой.
+
+    AsyncImage в карточках тогда берёт уже скачанный битмап из кэша Loader,
+    а не стартует по HTTP-запросу на карточку с главного потока.
+    """
+    for url in urls:
+        if url:
+            try:
+                Loader.image(url)
+            except Exception:
+                pass
+
+
+# Маркеры «текст на самом деле не статья»: экстрактор ставит их в начало
+# строки, поэтому достаточно одного C-уровневого прохода regex по префиксу
+# вместо нескольких питоновских substring-проверок по всему тексту
+_BAD_TEXT_RE = re.compile(r"Статья недоступна|требуется согласие", re.IGNORECASE)
+
+
+# Дальше этого объёма статью всё равно никто не прокручивает, а shaping
+# и текстура растут линейно с длиной текста
+_ARTICLE_MAX_CHARS = 64_000
+
+
+def _normalize_article_text(text: str) -> str:
+    """Подготовить текст статьи к показу (выполняется в рабочем потоке).
+
+    Пустые параграфы и краевые пробелы убираются до передачи в Kivy,
+    сверхдлинные статьи обрезаются по границе параграфа; в кэш попадает
+    уже нормализованная строка, так что повторные показы ничего не делают.
+    """
+    paragraphs = (p.strip() for p in text.split("\n\n"))
+    text = "\n\n".join(p for p in paragraphs if p)
+    if len(text) > _ARTICLE_MAX_CHARS:
+        text = (text[:_ARTICLE_MAX_CHARS].rsplit("\n\n", 1)[0]
+                + "\n\n…Статья сокращена. Полный текст — в браузере (кнопка 🌐 вверху).")
+    return text
+
+
+def _measure_article_height(text: str, width: float) -> float:
+    """Промерить высоту текста статьи вне UI-потока (аналог PrecomputedText).
+
+    CoreLabel с теми же параметрами шрифта, что и text_label статьи,
+    выполняет glyph shaping и перенос строк в рабочем потоке; UI-потоку
+    остаётся присвоить текст и готовую высоту.
+    """
+    cl = CoreLabel(text=text, font_size=_SP16, line_height=1.5, text_size=(width, None))
+    cl.refresh()
+    return cl.content_size[1]
+
+
+def _format_meta(payload: Dict[str, str]) -> str:
+    """Собрать строку "дата · источник" для карточки результата."""
+    published = payload.get("published", "")
+    source = payload.get("source", "")
+    meta_text = ""
+    if published:
+        try:
+            dt = email_utils.parsedate_to_datetime(published)
+            meta_text = f"{dt.day} {_MONTHS_RU_SHORT.get(dt.month, dt.month)} {dt.year}"
+        except Exception:
+            # Если не удалось распарсить, показываем как есть
+            meta_text = published[:16] if len(published) > 16 else published
+    if source:
+        meta_text = f"{meta_text} · {source}" if meta_text else source
+    return meta_text
+
+
+# KV-правило компилируется один раз на класс: все биндинги (перенос текста,
+# высота по texture_size, скрытие пустой картинки) разделяются экземплярами
+# вместо пары python-замыканий на каждый label каждой карточки.
+Builder.load_string("""
+<ResultCard>:
+    orientation: "vertical"
+    padding: "14dp"
+    spacing: "10dp"
+    radius: [12]
+    size_hint_y: None
+    adaptive_height: True
+    md_bg_color: 1, 1, 1, 1
+    AsyncImage:
+        source: root.image_url
+        size_hint_y: None
+        height: "160dp" if root.image_url else "0dp"
+        allow_stretch: True
+        keep_ratio: True
+    MDLabel:
+        text: root.title
+        theme_text_color: "Custom"
+        text_color: 0.05, 0.05, 0.05, 1
+        font_style: "H6"
+        bold: True
+        size_hint_y: None
+        text_size: self.width, None
+        height: self.texture_size[1]
+    MDLabel:
+        text: root.meta
+        theme_text_color: "Custom"
+        text_color: 0.6, 0.6, 0.6, 1
+        font_size: "11sp"
+        size_hint_y: None
+        height: "18dp"
+        halign: "left"
+        text_size: self.width, None
+    MDLabel:
+        text: root.snippet or "Прочитать полную статью"
+        theme_text_color: "Custom"
+        text_color: 0.5, 0.5, 0.5, 1
+        font_size: "12sp"
+        size_hint_y: None
+        text_size: self.width, None
+        height: self.texture_size[1]
+    MDBoxLayout:
+        orientation: "horizontal"
+        size_hint_y: None
+        height: "36dp"
+        MDLabel:
+            size_hint_x: None
+            width: "0dp"
+        MDRaisedButton:
+            text: "→"
+            font_size: "22sp"
+            size_hint: None, 1
+            width: "52dp"
+            md_bg_color: 0.15, 0.55, 0.75, 1
+            on_release: root._open_link()
+
+<MarketChip>:
+    padding: "10dp"
+    radius: [10]
+    md_bg_color: 0.95, 0.97, 1, 1
+    size_hint: None, None
+    width: "110dp"
+    height: "130dp"
+    MDBoxLayout:
+        orientation: "vertical"
+        spacing: "2dp"
+        MDIconButton:
+            icon: root.icon
+            icon_size: "24sp"
+            size_hint_y: None
+            height: "32dp"
+            disabled: True
+            theme_icon_color: "Custom"
+            icon_color: 0.3, 0.5, 0.8, 1
+        MDLabel:
+            text: root.code
+            font_style: "Subtitle1"
+            halign: "left"
+            theme_text_color: "Secondary"
+            size_hint_y: None
+            height: "20dp"
+        MDLabel:
+            text: root.val
+            font_style: "H6"
+            halign: "left"
+            theme_text_color: "Primary"
+            size_hint_y: None
+            height: "60dp"
+""")
+
 
 class ResultCard(MDCard):
-    """Карточка сниппета с кнопкой загрузки полного текста."""
+    """Карточка сниппета; viewclass для RecycleView результатов поиска.
 
-    def __init__(self, payload: Dict[str, str], on_read: object, **kwargs: object) -> None:
-        super().__init__(**kwargs)
-        self.orientation = "vertical"
-        self.padding = "14dp"
-        self.spacing = "10dp"
-        self.radius = [12]
-        self.size_hint_y = None
-        self.adaptive_height = True
-        self.md_bg_color = (1, 1, 1, 1)
-        self.link = payload.get("link", "")
-        image_url = payload.get("image")
+    Дерево и биндинги описаны KV-правилом выше; RecycleView обновляет
+    готовые карточки через свойства при прокрутке.
+    """
 
-        if image_url:
-            preview = AsyncImage(
-                source=image_url,
-                size_hint_y=None,
-                height="160dp",
-                allow_stretch=True,
-                keep_ratio=True,
-            )
-            self.add_widget(preview)
+    title = StringProperty("")
+    snippet = StringProperty("")
+    meta = StringProperty("")
+    image_url = StringProperty("")
+    link = StringProperty("")
 
-        title = payload.get("title", "Без заголовка")
-        snippet = payload.get("snippet") or payload.get("description") or payload.get("full_text") or ""
+    def _open_link(self, *_args: object) -> None:
+        app = MDApp.get_running_app()
+        if app and self.link:
+            app.show_article_in_webview(self.link)
 
-        title_label = MDLabel(
-            text=title,
-            theme_text_color="Custom",
-            text_color=(0.05, 0.05, 0.05, 1),
-            font_style="H6",
-            bold=True,
-            size_hint_y=None,
-        )
-        title_label.bind(texture_size=lambda inst, val: setattr(inst, "height", val[1]))
-        title_label.bind(width=lambda inst, val: setattr(inst, "text_size", (val, None)))
-        self.add_widget(title_label)
-
-        # Дата и источник
-        published = payload.get("published", "")
-        source = payload.get("source", "")
-        meta_text = ""
-        if published:
-            # Форматируем дату
-            try:
-                from datetime import datetime
-                import email.utils as email_utils
-                # Пробуем распарсить дату
-                try:
-                    dt = email_utils.parsedate_to_datetime(published)
-                    # Форматируем как "19 дек 2025"
-                    months_ru = {1: "янв", 2: "фев", 3: "мар", 4: "апр", 5: "мая", 6: "июн",
-                                 7: "июл", 8: "авг", 9: "сен", 10: "окт", 11: "ноя", 12: "дек"}
-                    date_str = f"{dt.day} {months_ru.get(dt.month, dt.month)} {dt.year}"
-                    meta_text = date_str
-                except:
-                    # Если не удалось распарсить, показываем как есть
-                    meta_text = published[:16] if len(published) > 16 else published
-            except:
-                pass
-        
-        if source:
-            if meta_text:
-                meta_text = f"{meta_text} · {source}"
-            else:
-                meta_text = source
-        
-        if meta_text:
-            meta_label = MDLabel(
-                text=meta_text,
-                theme_text_color="Custom",
-                text_color=(0.6, 0.6, 0.6, 1),
-                font_size="11sp",
-                size_hint_y=None,
-                height="18dp",
-                halign="left"
-            )
-            meta_label.bind(width=lambda inst, val: setattr(inst, "text_size", (val, None)))
-            self.add_widget(meta_label)
-
-        snippet_label = MDLabel(
-            text=snippet or "Прочитать полную статью",
-            theme_text_color="Custom",
-            text_color=(0.5, 0.5, 0.5, 1),
-            font_size="12sp",
-            size_hint_y=None,
-        )
-        snippet_label.bind(texture_size=lambda inst, val: setattr(inst, "height", val[1]))
-        snippet_label.bind(width=lambda inst, val: setattr(inst, "text_size", (val, None)))
-        self.add_widget(snippet_label)
-
-        button_row = MDBoxLayout(orientation="horizontal", size_hint_y=None, height="36dp")
-        button_row.add_widget(MDLabel(size_hint_x=None, width="0dp"))
-        action_btn = MDRaisedButton(
-            text="→",
-            font_size="22sp",
-            size_hint=(None, 1),
-            width="52dp",
-            md_bg_color=(0.15, 0.55, 0.75, 1),
-        )
-        action_btn.bind(on_release=lambda *_: on_read(self.link))
-        button_row.add_widget(action_btn)
-        self.add_widget(button_row)
+
+class MarketChip(MDCard):
+    """Чип инструмента на полосе «Рынки»; viewclass горизонтального RecycleView."""
+
+    code = StringProperty("")
+    val = StringProperty("")
+    icon = StringProperty("")
 
 
 class SearchScreen(Screen):
@@ -150,40 +394,53 @@ class SearchScreen(Screen):
     def __init__(self, app: NewsSearchApp, **kwargs: object) -> None:
         super().__init__(**kwargs)
         self.app = app
-        self.article_cache: Dict[str, str] = {}
-        self.article_payloads: Dict[str, Dict[str, str]] = {}
-        layout = MDBoxLayout(orientation="vertical", padding="12dp", spacing="12dp")
+        self.article_cache: Dict[str, str] = _LRU(128)
+        self.article_payloads: Dict[str, Dict[str, str]] = _LRU(256)
+        # Фан-ин из рабочих потоков: один заранее созданный триггер вместо
+        # нового ClockEvent + partial на каждое событие. append/popleft у
+        # deque атомарны, поэтому очередь безопасна без блокировки.
+        self._pending: deque = deque()
+        self._flush_trig = Clock.create_trigger(self._flush_pending, 0)
+        layout = MDBoxLayout(orientation="vertical", padding=_DP12, spacing=_DP12)
 
         # Добавим отступ сверху, чтобы toolbar не перекрывал содержимое, если используется
         layout.padding = (12, 12, 12, 12)
 
-        # Center the search row horizontally using an AnchorLayout
         # Avoid fixed widths on mobile: make the row expand to available width.
-        search_row = MDBoxLayout(size_hint=(1, None), height=dp(56), spacing=dp(10))
+        search_row = MDBoxLayout(size_hint=(1, None), height=_DP56, spacing=_DP10)
         self.query_field = MDTextField(hint_text="Что искать?", mode="rectangle")
         # Let the text field take remaining space and use a compact icon button for search
         self.query_field.size_hint_x = 1
-        search_button = MDIconButton(icon="magnify", icon_size="24sp", size_hint=(None, 1), width=dp(56))
+        search_button = MDIconButton(icon="magnify", icon_size=_SP24, size_hint=(None, 1), width=_DP56)
         search_button.bind(on_release=self.on_search)
         search_row.add_widget(self.query_field)
         search_row.add_widget(search_button)
-        search_anchor = AnchorLayout(size_hint_y=None, height=dp(56), padding=(dp(0), dp(0), dp(0), dp(0)))
-        search_anchor.add_widget(search_row)
 
         self.status_label = MDLabel(
             text="Введите тему новости и нажмите «Искать».",
             halign="left",
             size_hint_y=None,
-            height="28dp",
+            height=_DP28,
         )
 
-        self.list_scroll = MDScrollView()
-        self.results_list = MDList(spacing="12dp", padding="10dp")
-        self.list_scroll.add_widget(self.results_list)
+        # RecycleView держит в памяти только видимые карточки; остальные
+        # результаты живут как лёгкие dict'ы в .data
+        self.results_view = RecycleView()
+        self.results_view.viewclass = ResultCard
+        results_layout = RecycleBoxLayout(
+            orientation="vertical",
+            default_size=(None, _DP220),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=_DP12,
+            padding=_DP10,
+        )
+        results_layout.bind(minimum_height=results_layout.setter("height"))
+        self.results_view.add_widget(results_layout)
 
-        layout.add_widget(search_anchor)
+        layout.add_widget(search_row)
         layout.add_widget(self.status_label)
-        layout.add_widget(self.list_scroll)
+        layout.add_widget(self.results_view)
         self.add_widget(layout)
 
     def on_search(self, _instance: object) -> None:
@@ -192,8 +449,24 @@ class SearchScreen(Screen):
             toast("Укажите текст запроса.")
             return
         self.status_label.text = "Ищу новости..."
-        self.results_list.clear_widgets()
-        threading.Thread(target=self._perform_search, args=(query,), daemon=True).start()
+        self.results_view.data = []
+        # Общий пул вместо нового потока на каждый поиск
+        self.app._executor.submit(self._perform_search, query)
+
+    def _post(self, kind: str, payload: object) -> None:
+        """Передать событие из рабочего потока в UI через общий триггер."""
+        self._pending.append((kind, payload))
+        self._flush_trig()
+
+    def _flush_pending(self, _dt: float) -> None:
+        """Разобрать все накопившиеся события за один тик Clock."""
+        while self._pending:
+            kind, payload = self._pending.popleft()
+            if kind == "status":
+                self.status_label.text = payload
+            elif kind == "populate":
+                results, query = payload
+                self._populate_results(results, query)
 
     def _perform_search(self, query: str) -> None:
         # ТЕСТОВЫЙ РЕЖИМ - раскомментируйте для проверки UI
@@ -206,7 +479,7 @@ class SearchScreen(Screen):
         #     "image": None,
         #     "full_text": "Это полный текст тестовой новости. Здесь достаточно текста чтобы пройти фильтр минимальной длины. Lorem ipsum dolor sit amet, consectetur adipiscing elit."
         # }]
-        # Clock.schedule_once(partial(self._populate_results, test_results, query), 0)
+        # self._post("populate", (test_results, query))
         # return
         
         try:
@@ -215,62 +488,83 @@ class SearchScreen(Screen):
                 try:
                     from android.permissions import request_permissions, Permission
                     request_permissions([Permission.INTERNET, Permission.ACCESS_NETWORK_STATE])
-                    print("[PERMISSIONS] Permissions requested")
+                    log.debug("[PERMISSIONS] Permissions requested")
                 except Exception as e:
-                    print(f"[PERMISSIONS] Could not request permissions: {e}")
+                    log.debug("[PERMISSIONS] Could not request permissions: %s", e)
             
             # Получаем основные результаты БЕЗ КОНТЕНТА (быстрее)
-            print(f"[SEARCH] ===== Starting search for: '{query}' =====")
-            Clock.schedule_once(partial(self._set_status, "Загружаю новости..."), 0)
+            log.debug("[SEARCH] ===== Starting search for: '%s' =====", query)
+            self._post("status", "Загружаю новости...")
             
-            print(f"[SEARCH] Calling get_news_with_content...")
+            log.debug("[SEARCH] Calling get_news_with_content...")
             # Используем "all" для поиска из нескольких источников (Bing + Google)
             results = get_news_with_content(query, max_results=15, fetch_content=False, source="all")
-            print(f"[SEARCH] get_news_with_content returned {len(results)} results")
+            log.debug("[SEARCH] get_news_with_content returned %d results", len(results))
             
             if not results:
-                print(f"[SEARCH] No results returned, checking for errors...")
-                Clock.schedule_once(partial(self._set_status, f"Не удалось найти новости. Проверьте подключение к интернету."), 0)
+                log.debug("[SEARCH] No results returned, checking for errors...")
+                self._post("status", "Не удалось найти новости. Проверьте подключение к интернету.")
                 return
             
-            # Пока отключаем синонимы для отладки
-            # print(f"[SEARCH] Found {len(results)} initial results")
-            # try:
-            #     print(f"[SYNONYMS] Generating synonyms for: {query}")
-            #     synonyms = llm_client.generate_related_keywords(query, max_keywords=3, timeout=2.0)
-            #     print(f"[SYNONYMS] Got synonyms: {synonyms}")
-            #     
-            #     for synonym in synonyms:
-            #         if synonym.lower() != query.lower():
-            #             print(f"[SYNONYMS] Searching for synonym: {synonym}")
-            #             syn_results = get_news_with_content(synonym, max_results=3, fetch_content=True)
-            #             print(f"[SYNONYMS] Found {len(syn_results)} results for '{synonym}'")
-            #             results.extend(syn_results)
-            # except Exception as e:
-            #     print(f"[SYNONYMS] Error: {e}")
-            #     import traceback
-            #     traceback.print_exc()
-            
-            # Удаляем дубликаты по ссылке
-            seen_links = set()
-            unique_results = []
+            # Обогащение синонимами — только когда основная выдача скудная:
+            # при достаточном числе результатов дополнительные запросы дают
+            # разве что дубликаты, а стоят до трёх сетевых раундтрипов
+            if len(results) < 4:
+                try:
+                    synonyms = _synonym_cache.get(query)
+                    if synonyms is None:
+                        log.debug("[SYNONYMS] Generating synonyms for: %s", query)
+                        synonyms = llm_client.generate_related_keywords(query, max_keywords=3, timeout=2.0)
+                        _synonym_cache[query] = synonyms
+                    # Запросы по синонимам независимы: отправляем их в общий
+                    # пул разом, итоговое время — максимум из латентностей,
+                    # а не их сумма
+                    futures = [
+                        self.app._executor.submit(
+                            get_news_with_content, synonym,
+                            max_results=2, fetch_content=False, source="all",
+                        )
+                        for synonym in synonyms
+                        if synonym.lower() != query.lower()
+                    ]
+                    for future in as_completed(futures, timeout=10.0):
+                        exc = future.exception()
+                        if exc is not None:
+                            log.debug("[SYNONYMS] Fetch failed: %s", exc)
+                            continue
+                        syn_results = future.result()
+                        log.debug("[SYNONYMS] Got %d extra results", len(syn_results))
+                        results.extend(syn_results)
+                except Exception as e:
+                    log.debug("[SYNONYMS] Error: %s", e)
+
+            # Дедупликация и лимит одним проходом: как только набрано 12
+            # результатов, перебор прекращается — не строим полный словарь
+            # ради последующего среза; результаты без ссылки различаем по id
+            seen: set = set()
+            unique_results: List[Dict] = []
             for r in results:
                 link = r.get("link", "")
-                if link and link not in seen_links:
-                    seen_links.add(link)
-                    unique_results.append(r)
-                elif not link:
-                    unique_results.append(r)
-            
-            results = unique_results[:12]  # Ограничиваем до 12 результатов
-            print(f"[SEARCH] Total unique results: {len(results)}")
+                # Одни и те же URL повторяются между запросами и синонимами;
+                # интернирование даёт сравнение по указателю в set и один
+                # общий str-объект на все кэши, куда ссылка попадёт дальше
+                key = sys.intern(link) if link else id(r)
+                if key in seen:
+                    continue
+                if link:
+                    r["link"] = key
+                seen.add(key)
+                unique_results.append(r)
+                if len(unique_results) == 12:
+                    break
+
+            results = unique_results
+            log.debug("[SEARCH] Total unique results: %d", len(results))
             
         except Exception as exc:
             error_type = type(exc).__name__
             error_msg = str(exc)
-            print(f"[SEARCH] Error ({error_type}): {error_msg}")
-            import traceback
-            traceback.print_exc()
+            log.exception("[SEARCH] Error (%s): %s", error_type, error_msg)
             
             # Формируем понятное сообщение об ошибке
             if "ConnectionError" in error_type or "Timeout" in error_type:
@@ -282,32 +576,17 @@ class SearchScreen(Screen):
             else:
                 user_msg = f"Ошибка поиска: {error_type}\n{error_msg[:100]}"
             
-            Clock.schedule_once(partial(self._set_status, user_msg), 0)
+            self._post("status", user_msg)
             Clock.schedule_once(lambda *_: toast(user_msg), 0)
             return
-        Clock.schedule_once(partial(self._populate_results, results, query), 0)
-
-    def _set_status(self, text: str, _: float) -> None:
-        self.status_label.text = text
+        self._post("populate", (results, query))
 
-    def _populate_results(self, results: List[Dict[str, str]], query: str, _: float) -> None:
+    def _populate_results(self, results: List[Dict[str, str]], query: str) -> None:
         if not results:
             self.status_label.text = f"По запросу \"{query}\" ничего не найдено. Попробуйте другой запрос."
             return
         self.status_label.text = f"Найдено {len(results)} статей. Нажмите на статью для загрузки полного текста."
-        for idx, payload in enumerate(results):
-            # Контейнер для каждой карточки
-            card_container = MDBoxLayout(
-                orientation="vertical",
-                size_hint_y=None,
-                adaptive_height=True,
-                padding="4dp",
-                spacing="4dp",
-            )
-            card = ResultCard(payload, on_read=self.app.show_article_in_webview)
-            card_container.add_widget(card)
-            self.results_list.add_widget(card_container)
-
+        for payload in results:
             link = payload.get("link", "")
             if link:
                 self.article_payloads[link] = payload
@@ -315,11 +594,51 @@ class SearchScreen(Screen):
                 cached_text = payload.get("full_text", "")
                 if cached_text:
                     self.article_cache[link] = cached_text
-            
-            # Добавляем разделитель между карточками (кроме последней)
-            if idx < len(results) - 1:
-                separator = MDBoxLayout(size_hint_y=None, height="6dp")
-                self.results_list.add_widget(separator)
+
+        # Прогреваем только первый экран превью: карточки ниже создаются
+        # RecycleView лениво, и их AsyncImage сам запросит картинку, когда
+        # (и если) пользователь до неё доскроллит. Качать все 12 сразу —
+        # лишняя сеть и борьба за воркеров Loader в момент первого кадра.
+        _prefetch_images([payload.get("image") for payload in results[:4]])
+
+        # Одно присваивание data вместо add_widget на каждую карточку
+        self.results_view.data = [
+            {
+                "title": payload.get("title") or "Без заголовка",
+                "snippet": payload.get("snippet") or payload.get("description") or payload.get("full_text") or "",
+                "meta": _format_meta(payload),
+                "image_url": payload.get("image") or "",
+                "link": payload.get("link") or "",
+            }
+            for payload in results
+        ]
+
+        # Пока пользователь просматривает список, фоном скачиваем тексты
+        # верхних статей — тап по карточке из первого экрана открывается
+        # мгновенно. Одна последовательная задача занимает один воркер
+        # пула, остальные остаются свободны для действий пользователя.
+        self.app._executor.submit(self._prefetch_articles, results[:6])
+
+    def _prefetch_articles(self, results: List[Dict[str, str]]) -> None:
+        """Заранее загрузить полные тексты первых статей в article_cache."""
+        for payload in results:
+            link = payload.get("link", "")
+            if not link or len(self.article_cache.get(link, "")) > 500:
+                continue
+            if cache.load_article(link) is not None:
+                continue
+            try:
+                content = fetch_article_content(link, title=payload.get("title", ""))
+                text = _normalize_article_text(content.get("full_text") or "")
+                if len(text) >= 200 and not _BAD_TEXT_RE.search(text[:500]):
+                    payload["full_text"] = text
+                    if content.get("image"):
+                        payload["image"] = content["image"]
+                    self.article_cache[link] = text
+                    cache.store_article(link, {"full_text": text, "image": content.get("image") or ""})
+                    log.debug("[PREFETCH] Cached %d chars for %s", len(text), link[:60])
+            except Exception as e:
+                log.debug("[PREFETCH] Failed for %s: %s", link[:60], e)
 
 
 class HomeScreen(Screen):
@@ -333,12 +652,18 @@ class HomeScreen(Screen):
         
         # Создаем начальный UI с загрузкой, затем асинхронно загрузим данные
         self._build_loading_ui()
-        threading.Thread(target=self._fetch_and_build, daemon=True).start()
+        # Повторный заход на экран в течение минуты рисуем из памяти приложения
+        # без какого-либо I/O (stale-while-revalidate с TTL 60 c)
+        last_data = app._last_home_data
+        if last_data and time.monotonic() - app._last_home_ts < 60:
+            Clock.schedule_once(lambda dt: self._build_ui(*last_data), 0)
+        else:
+            app._executor.submit(self._fetch_and_build)
 
     def _build_loading_ui(self):
         """Показать экран загрузки."""
         scroll = MDScrollView()
-        layout = MDBoxLayout(orientation="vertical", padding="16dp", spacing="14dp", size_hint_y=None)
+        layout = MDBoxLayout(orientation="vertical", padding=_DP16, spacing=_DP14, size_hint_y=None)
         layout.bind(minimum_height=layout.setter("height"))
         layout.add_widget(MDLabel(text="Загружаю данные...", halign="center", font_style="H6"))
         scroll.add_widget(layout)
@@ -351,71 +676,61 @@ class HomeScreen(Screen):
         search_screen.on_search(None)
 
     def _fetch_and_build(self):
-        """Загрузить данные из API и построить UI."""
-        # Координаты Уфы: 54.74, 55.97
-        weather_data = get_weather(54.74, 55.97)
-        # Запрашиваем все финансовые инструменты (функция использует дефолтный список из backend.py)
-        fin_data = get_financial_data()
-        trending_data = get_google_trends()
-        
-        print(f"[FINANCE] Got data for {len(fin_data)} instruments: {list(fin_data.keys())}")
-        
-        Clock.schedule_once(lambda dt: self._build_ui(weather_data, fin_data, trending_data), 0)
+        """Загрузить данные (из дискового кэша или API) и построить UI."""
+        # Тёплый старт: если все три ответа ещё свежие на диске,
+        # рисуем немедленно и в сеть не ходим вообще.
+        weather_data = cache.load("weather", 600)
+        fin_data = cache.load("finance", 300)
+        trending_data = cache.load("trends", 1800)
+        if weather_data is not None and fin_data is not None and trending_data is not None:
+            log.debug("[HOME] Rendering from disk cache")
+            self._remember_home_data(weather_data, fin_data, trending_data)
+            self.app._post_ui(self._build_ui, weather_data, fin_data, trending_data)
+            return
+
+        # Координаты Уфы: 54.74, 55.97. Погода, финансы и тренды
+        # загружаются параллельно внутри refresh_all.
+        dashboard = refresh_all(54.74, 55.97)
+        weather_data = dashboard["weather"]
+        fin_data = dashboard["financial"]
+        trending_data = dashboard["trends"]
+
+        cache.store("weather", weather_data)
+        cache.store("finance", fin_data)
+        cache.store("trends", trending_data)
+
+        log.debug("[FINANCE] Got data for %d instruments: %s", len(fin_data), list(fin_data))
+
+        self._remember_home_data(weather_data, fin_data, trending_data)
+        self.app._post_ui(self._build_ui, weather_data, fin_data, trending_data)
+
+    def _remember_home_data(self, weather_data: dict, fin_data: dict, trending_data: list) -> None:
+        """Запомнить данные в памяти приложения для мгновенного повторного показа."""
+        self.app._last_home_data = (weather_data, fin_data, trending_data)
+        self.app._last_home_ts = time.monotonic()
 
     def _build_ui(self, weather_data: dict, fin_data: dict, trending_data: list, _dt=0):
         """Построить UI с реальными данными."""
         self.clear_widgets()
         
         now = datetime.datetime.now()
-        months = {
-            1: "января", 2: "февраля", 3: "марта", 4: "апреля", 5: "мая", 6: "июня",
-            7: "июля", 8: "августа", 9: "сентября", 10: "октября", 11: "ноября", 12: "декабря",
-        }
-        days = {0: "Понедельник", 1: "Вторник", 2: "Среда", 3: "Четверг", 4: "Пятница", 5: "Суббота", 6: "Воскресенье"}
-        ru_date = f"{now.day} {months[now.month]}, {days[now.weekday()]}"
+        ru_date = f"{now.day} {_MONTHS_RU[now.month]}, {_DAYS_RU[now.weekday()]}"
 
         # Обработка погоды
         temp = weather_data.get('temperature', 0)
         wind = weather_data.get('windspeed', 0)
         w_code = weather_data.get('weathercode', 0)
-        cond = "Ясно" if w_code == 0 else "Облачно" if w_code in [1,2,3] else "Дождь" if w_code in [61,63,65] else "Облачно"
-        icon = "weather-sunny" if w_code == 0 else "weather-cloudy" if w_code in [1,2,3] else "weather-rainy" if w_code in [61,63,65] else "weather-cloudy"
+        cond, icon = _WEATHER_BY_CODE.get(w_code, _WEATHER_DEFAULT)
         weather = {"city": "Уфа", "temp": f"{int(temp)}°", "cond": cond, "wind": f"{int(wind)} м/с", "hum": "45%", "icon": icon}
         
-        # Обработка финансов
-        print(f"[FINANCE BUILD] Processing fin_data: {fin_data}")
-        usd_rate = fin_data.get('RUB=X', 0.0)
-        eur_rate = fin_data.get('EURRUB=X', 0.0)
-        print(f"[FINANCE BUILD] USD rate: {usd_rate}, EUR rate: {eur_rate}")
-        
-        # Формируем список всех инструментов (всегда показываем, даже если нет данных)
-        instruments = []
-        
-        # Валюты
-        instruments.append(("USD", f"{usd_rate:.2f} ₽" if usd_rate else "—", "currency-usd"))
-        instruments.append(("EUR", f"{eur_rate:.2f} ₽" if eur_rate else "—", "currency-eur"))
-        
-        # Акции (в долларах)
-        for symbol, name in [("NVDA", "NVIDIA"), ("AAPL", "Apple"), ("GOOGL", "Google"), 
-                              ("MSFT", "Microsoft"), ("TSLA", "Tesla"), ("AMZN", "Amazon")]:
-            price_usd = fin_data.get(symbol, 0.0)
-            print(f"[FINANCE BUILD] {name} ({symbol}): ${price_usd}")
-            if price_usd:
-                instruments.append((name, f"${price_usd:.2f}", "chart-line"))
-            else:
-                instruments.append((name, "—", "chart-line"))
-        
-        # Криптовалюты (в долларах)
-        for symbol, name in [("BTC-USD", "Bitcoin"), ("ETH-USD", "Ethereum")]:
-            price = fin_data.get(symbol, 0.0)
-            print(f"[FINANCE BUILD] {name} ({symbol}): ${price}")
-            if price:
-                instruments.append((name, f"${int(price):,}", "currency-btc"))
-            else:
-                instruments.append((name, "—", "currency-btc"))
-        
-        currencies = instruments
-        print(f"[FINANCE BUILD] Total instruments created: {len(currencies)}")
+        # Обработка финансов: одна таблица спецификаций и один проход
+        # (инструменты показываем всегда, даже если данных нет)
+        log.debug("[FINANCE BUILD] Processing fin_data: %s", fin_data)
+        currencies = [
+            (name, fmt(fin_data.get(symbol, 0.0)), icon)
+            for symbol, name, fmt, icon in _INSTR_SPECS
+        ]
+        log.debug("[FINANCE BUILD] Total instruments created: %d", len(currencies))
         
         # Тренды - показываем все загруженные
         trending = trending_data if trending_data else [
@@ -424,56 +739,47 @@ class HomeScreen(Screen):
             {"tag": "#World", "name": "Мировые события", "change": "+0.8%"},
         ]
         
-        categories = [
-            ("laptop", "Техно"),
-            ("soccer", "Спорт"),
-            ("briefcase", "Бизнес"),
-            ("atom", "Наука"),
-            ("movie", "Кино"),
-            ("music", "Музыка"),
-        ]
-
         scroll = MDScrollView()
-        root = MDBoxLayout(orientation="vertical", padding="16dp", spacing="14dp", size_hint_y=None)
+        root = MDBoxLayout(orientation="vertical", padding=_DP16, spacing=_DP14, size_hint_y=None)
         root.bind(minimum_height=root.setter("height"))
 
-        header = MDBoxLayout(orientation="vertical", spacing="4dp", size_hint_y=None, height="80dp")
+        header = MDBoxLayout(orientation="vertical", spacing=_DP4, size_hint_y=None, height=_DP80)
         header.add_widget(MDLabel(text="Добро пожаловать!", font_style="H5", halign="left"))
         header.add_widget(MDLabel(text=f"Сегодня {ru_date}", halign="left", theme_text_color="Secondary"))
         root.add_widget(header)
 
         # Погода
-        weather_card = MDCard(padding="14dp", radius=[14], md_bg_color=(0.15, 0.35, 0.65, 1), size_hint_y=None, height="180dp")
-        weather_layout = MDBoxLayout(orientation="vertical", spacing="8dp")
+        weather_card = MDCard(padding=_DP14, radius=[14], md_bg_color=(0.15, 0.35, 0.65, 1), size_hint_y=None, height=_DP180)
+        weather_layout = MDBoxLayout(orientation="vertical", spacing=_DP8)
         
         # Город с иконкой
-        weather_top = MDBoxLayout(orientation="horizontal", spacing="4dp", size_hint_y=None, height="28dp")
-        weather_top.add_widget(MDIconButton(icon="map-marker", icon_size="18sp", theme_text_color="Custom", text_color=(1,1,1,0.9), size_hint_x=None, width="32dp"))
-        weather_top.add_widget(MDLabel(text=weather["city"], theme_text_color="Custom", text_color=(1,1,1,0.95), bold=True, halign="left", size_hint_x=None, width="80dp"))
+        weather_top = MDBoxLayout(orientation="horizontal", spacing=_DP4, size_hint_y=None, height=_DP28)
+        weather_top.add_widget(MDIconButton(icon="map-marker", icon_size=_SP18, theme_text_color="Custom", text_color=(1,1,1,0.9), size_hint_x=None, width=_DP32))
+        weather_top.add_widget(MDLabel(text=weather["city"], theme_text_color="Custom", text_color=(1,1,1,0.95), bold=True, halign="left", size_hint_x=None, width=_DP80))
         weather_top.add_widget(MDLabel(text=""))  # Spacer
         weather_layout.add_widget(weather_top)
         
         # Температура и состояние
-        weather_mid = MDBoxLayout(orientation="horizontal", spacing="16dp", size_hint_y=None, height="64dp")
-        temp_label = MDLabel(text=weather["temp"], font_style="H3", theme_text_color="Custom", text_color=(1,1,1,1), size_hint_x=None, width="120dp", halign="left")
+        weather_mid = MDBoxLayout(orientation="horizontal", spacing=_DP16, size_hint_y=None, height=_DP64)
+        temp_label = MDLabel(text=weather["temp"], font_style="H3", theme_text_color="Custom", text_color=(1,1,1,1), size_hint_x=None, width=_DP120, halign="left")
         weather_mid.add_widget(temp_label)
         
         # Состояние и иконка в вертикальном контейнере
-        cond_container = MDBoxLayout(orientation="vertical", spacing="4dp")
-        cond_label = MDLabel(text=weather["cond"], theme_text_color="Custom", text_color=(1,1,1,0.9), halign="left", valign="bottom", size_hint_y=None, height="28dp")
-        cond_label.bind(width=lambda inst, val: setattr(inst, "text_size", (val, None)))
+        cond_container = MDBoxLayout(orientation="vertical", spacing=_DP4)
+        cond_label = MDLabel(text=weather["cond"], theme_text_color="Custom", text_color=(1,1,1,0.9), halign="left", valign="bottom", size_hint_y=None, height=_DP28)
+        cond_label.bind(width=_bind_text_wrap)
         cond_container.add_widget(cond_label)
         cond_container.add_widget(MDLabel(text=""))  # Spacer
         weather_mid.add_widget(cond_container)
         
-        # Иконка погоды справа
-        icon_anchor = AnchorLayout(anchor_x="right", anchor_y="center")
-        icon_anchor.add_widget(MDIconButton(icon=weather["icon"], icon_size="42sp", theme_text_color="Custom", text_color=(1,1,1,0.95)))
-        weather_mid.add_widget(icon_anchor)
+        # Иконка погоды справа: контейнер состояния забирает всю гибкую
+        # ширину, поэтому кнопка фиксированного размера и так прижата к
+        # правому краю — обёртка AnchorLayout не нужна
+        weather_mid.add_widget(MDIconButton(icon=weather["icon"], icon_size=_SP42, theme_text_color="Custom", text_color=(1,1,1,0.95), pos_hint={"center_y": 0.5}))
         weather_layout.add_widget(weather_mid)
         
         # Ветер и влажность
-        weather_bot = MDBoxLayout(orientation="horizontal", spacing="16dp", size_hint_y=None, height="28dp")
+        weather_bot = MDBoxLayout(orientation="horizontal", spacing=_DP16, size_hint_y=None, height=_DP28)
         weather_bot.add_widget(MDLabel(text=f"Ветер {weather['wind']}", theme_text_color="Custom", text_color=(1,1,1,0.85), halign="left"))
         weather_bot.add_widget(MDLabel(text=f"Влажность {weather['hum']}", theme_text_color="Custom", text_color=(1,1,1,0.85), halign="right"))
         weather_layout.add_widget(weather_bot)
@@ -481,125 +787,56 @@ class HomeScreen(Screen):
         root.add_widget(weather_card)
 
         # Рынки с горизонтальной прокруткой (свайпом)
-        market_card = MDCard(padding="14dp", radius=[14], md_bg_color=(1,1,1,1), size_hint_y=None, height="200dp")
-        market_outer = MDBoxLayout(orientation="vertical", spacing="6dp")
+        market_card = MDCard(padding=_DP14, radius=[14], md_bg_color=(1,1,1,1), size_hint_y=None, height=_DP200)
+        market_outer = MDBoxLayout(orientation="vertical", spacing=_DP6)
         
         # Заголовок
-        market_header = MDBoxLayout(orientation="horizontal", spacing="8dp", size_hint_y=None, height="28dp")
+        market_header = MDBoxLayout(orientation="horizontal", spacing=_DP8, size_hint_y=None, height=_DP28)
         market_header.add_widget(MDLabel(text="Рынки", font_style="H6", halign="left", theme_text_color="Primary"))
         market_outer.add_widget(market_header)
         
-        # Горизонтальный скролл для всех инструментов
-        market_scroll = MDScrollView(do_scroll_x=True, do_scroll_y=False, size_hint_y=None, height="140dp", bar_width=0)
-        market_container = MDBoxLayout(orientation="horizontal", spacing="10dp", size_hint=(None, None), height="130dp", padding="0dp")
-        market_container.bind(minimum_width=market_container.setter("width"))
-        
-        # Добавляем все инструменты
-        for code, val, icon in currencies:
-            chip = MDCard(padding="10dp", radius=[10], md_bg_color=(0.95,0.97,1,1), size_hint=(None, None), width="110dp", height="130dp")
-            chip_layout = MDBoxLayout(orientation="vertical", spacing="2dp")
-            chip_layout.add_widget(MDIconButton(icon=icon, icon_size="24sp", size_hint_y=None, height="32dp", disabled=True, theme_icon_color="Custom", icon_color=(0.3, 0.5, 0.8, 1)))
-            chip_layout.add_widget(MDLabel(text=code, font_style="Subtitle1", halign="left", theme_text_color="Secondary", size_hint_y=None, height="20dp"))
-            chip_layout.add_widget(MDLabel(text=val, font_style="H6", halign="left", theme_text_color="Primary", size_hint_y=None, height="60dp"))
-            chip.add_widget(chip_layout)
-            market_container.add_widget(chip)
-        
-        market_scroll.add_widget(market_container)
-        market_outer.add_widget(market_scroll)
+        # Горизонтальный RecycleView: из десяти чипов материализуются только
+        # те, что влезают на экран, остальные — лёгкие dict'ы в .data
+        market_rv = RecycleView(do_scroll_x=True, do_scroll_y=False, size_hint_y=None, height=_DP140, bar_width=0)
+        market_rv.viewclass = MarketChip
+        market_layout = RecycleBoxLayout(
+            orientation="horizontal",
+            default_size=(_DP110, _DP130),
+            default_size_hint=(None, None),
+            size_hint=(None, None),
+            height=_DP130,
+            spacing=_DP10,
+        )
+        market_layout.bind(minimum_width=market_layout.setter("width"))
+        market_rv.add_widget(market_layout)
+        market_rv.data = [{"code": code, "val": val, "icon": icon} for code, val, icon in currencies]
+        market_outer.add_widget(market_rv)
         market_card.add_widget(market_outer)
         root.add_widget(market_card)
 
         # Тренды с навигацией
-        trend_card = MDCard(padding="14dp", radius=[14], md_bg_color=(1,1,1,1), size_hint_y=None, height="260dp")
-        trend_outer = MDBoxLayout(orientation="vertical", spacing="6dp")
-        trend_header = MDBoxLayout(orientation="horizontal", spacing="8dp", size_hint_y=None, height="28dp")
-        trend_header.add_widget(MDIconButton(icon="trending-up", icon_size="20sp", size_hint_x=None, width="32dp"))
-        trend_header.add_widget(MDLabel(text="В тренде", font_style="H6", halign="left", size_hint_y=None, height="28dp"))
+        trend_card = MDCard(padding=_DP14, radius=[14], md_bg_color=(1,1,1,1), size_hint_y=None, height=_DP260)
+        trend_outer = MDBoxLayout(orientation="vertical", spacing=_DP6)
+        trend_header = MDBoxLayout(orientation="horizontal", spacing=_DP8, size_hint_y=None, height=_DP28)
+        trend_header.add_widget(MDIconButton(icon="trending-up", icon_size=_SP20, size_hint_x=None, width=_DP32))
+        trend_header.add_widget(MDLabel(text="В тренде", font_style="H6", halign="left", size_hint_y=None, height=_DP28))
         trend_outer.add_widget(trend_header)
         
         # Контейнер для отображения трендов
-        self.trend_container = MDBoxLayout(orientation="vertical", spacing="6dp", size_hint_y=None, height="180dp")
+        self.trend_container = MDBoxLayout(orientation="vertical", spacing=_DP6, size_hint_y=None, height=_DP180)
         self.trending_items = trending
         self.trend_index = 0
-        
-        def on_trend_click(query_text):
-            """Запустить поиск по тренду."""
-            self.app._go_to("search")
-            Clock.schedule_once(lambda dt: self._trigger_search(query_text), 0.2)
-        
-        def update_trends():
-            """Обновить отображаемые тренды."""
-            self.trend_container.clear_widgets()
-            # Показываем 2 тренда за раз
-            visible_count = 2
-            start = self.trend_index
-            end = min(start + visible_count, len(self.trending_items))
-            
-            for i in range(start, end):
-                item = self.trending_items[i]
-                row_container = MDCard(
-                    padding="10dp",
-                    radius=[8],
-                    md_bg_color=(0.98, 0.98, 1, 1),
-                    size_hint_y=None,
-                    height="82dp",
-                    ripple_behavior=True
-                )
-                row = MDBoxLayout(orientation="vertical", spacing="4dp")
-                
-                top_row = MDBoxLayout(orientation="horizontal", spacing="6dp", size_hint_y=None, height="20dp")
-                tag_label = MDLabel(
-                    text=item["tag"],
-                    theme_text_color="Secondary",
-                    size_hint_x=None,
-                    width="50dp",
-                    halign="left",
-                    font_size="10sp"
-                )
-                top_row.add_widget(tag_label)
-                change_label = MDLabel(
-                    text=item["change"],
-                    halign="right",
-                    theme_text_color="Secondary",
-                    font_size="10sp"
-                )
-                top_row.add_widget(change_label)
-                row.add_widget(top_row)
-                
-                name_label = MDLabel(
-                    text=item["name"],
-                    halign="left",
-                    valign="top",
-                    theme_text_color="Primary",
-                    font_size="13sp",
-                    size_hint_y=None,
-                    height="52dp"
-                )
-                name_label.bind(width=lambda inst, val: setattr(inst, "text_size", (val, None)))
-                row.add_widget(name_label)
-                
-                row_container.add_widget(row)
-                query = item["name"]
-                row_container.bind(on_release=lambda x, q=query: on_trend_click(q))
-                self.trend_container.add_widget(row_container)
-        
-        def scroll_up(*args):
-            if self.trend_index > 0:
-                self.trend_index -= 1
-                update_trends()
-        
-        def scroll_down(*args):
-            if self.trend_index < len(self.trending_items) - 2:
-                self.trend_index += 1
-                update_trends()
-        
-        update_trends()
+        # Строки трендов строятся один раз; пагинация лишь переставляет
+        # готовые виджеты, не создавая заново карточки/лейблы/биндинги
+        self._trend_rows = [self._build_trend_row(item) for item in trending]
+
+        self._update_trends()
         trend_outer.add_widget(self.trend_container)
         
         # Кнопки навигации
-        nav_buttons = MDBoxLayout(orientation="horizontal", spacing="8dp", size_hint_y=None, height="32dp")
-        up_btn = MDIconButton(icon="chevron-up", icon_size="24sp", on_release=scroll_up)
-        down_btn = MDIconButton(icon="chevron-down", icon_size="24sp", on_release=scroll_down)
+        nav_buttons = MDBoxLayout(orientation="horizontal", spacing=_DP8, size_hint_y=None, height=_DP32)
+        up_btn = MDIconButton(icon="chevron-up", icon_size=_SP24, on_release=self._scroll_trends_up)
+        down_btn = MDIconButton(icon="chevron-down", icon_size=_SP24, on_release=self._scroll_trends_down)
         nav_buttons.add_widget(MDLabel(text=""))  # Spacer
         nav_buttons.add_widget(up_btn)
         nav_buttons.add_widget(down_btn)
@@ -609,58 +846,119 @@ class HomeScreen(Screen):
         root.add_widget(trend_card)
 
         # Категории
-        cat_card = MDCard(padding="14dp", radius=[14], md_bg_color=(1,1,1,1), size_hint_y=None, height="260dp")
-        cat_layout = MDBoxLayout(orientation="vertical", spacing="10dp")
-        cat_layout.add_widget(MDLabel(text="Категории", font_style="H6", halign="center", size_hint_y=None, height="28dp"))
-        
-        grid_container = AnchorLayout(anchor_x="center", anchor_y="center")
-        grid = GridLayout(cols=3, spacing=10, padding=0, size_hint=(None, None), width="345dp", height="200dp")
-        
-        def on_category_click(category_name):
-            """Запустить поиск по категории."""
-            self.app._go_to("search")
-            Clock.schedule_once(lambda dt: self._trigger_search(category_name), 0.2)
-        
-        # Цвета для каждой категории
-        category_colors = [
-            (0.90, 0.95, 1.0, 1),    # Голубой - Техно
-            (0.95, 1.0, 0.90, 1),    # Зеленый - Спорт
-            (1.0, 0.95, 0.85, 1),    # Оранжевый - Бизнес
-            (0.95, 0.90, 1.0, 1),    # Фиолетовый - Наука
-            (1.0, 0.90, 0.90, 1),    # Розовый - Кино
-            (0.98, 0.98, 0.85, 1),   # Желтый - Музыка
-        ]
-        
-        for idx, (icon_name, label) in enumerate(categories):
-            color = category_colors[idx % len(category_colors)]
-            cell = MDCard(padding="10dp", radius=[12], md_bg_color=color, size_hint=(None, None), width="110dp", height="96dp", ripple_behavior=True)
-            cell_layout = MDBoxLayout(orientation="vertical", spacing="2dp")
-            
-            # Центрируем иконку
-            icon_container = AnchorLayout(anchor_x="center", anchor_y="center", size_hint_y=None, height="48dp")
-            icon_btn = MDIconButton(icon=icon_name, icon_size="32sp", disabled=True, theme_icon_color="Custom", icon_color=(0.3, 0.3, 0.3, 1))
-            icon_container.add_widget(icon_btn)
-            cell_layout.add_widget(icon_container)
+        cat_card = MDCard(padding=_DP14, radius=[14], md_bg_color=(1,1,1,1), size_hint_y=None, height=_DP260)
+        cat_layout = MDBoxLayout(orientation="vertical", spacing=_DP10)
+        cat_layout.add_widget(MDLabel(text="Категории", font_style="H6", halign="center", size_hint_y=None, height=_DP28))
+        
+        # Сетка фиксированного размера центрируется pos_hint'ом — вертикальный
+        # BoxLayout учитывает center_x, промежуточный AnchorLayout лишний
+        grid = GridLayout(cols=3, spacing=10, padding=0, size_hint=(None, None), width=_DP345, height=_DP200, pos_hint={"center_x": 0.5})
+        
+        for idx, (icon_name, label) in enumerate(_CATEGORIES):
+            color = _CATEGORY_COLORS[idx % len(_CATEGORY_COLORS)]
+            cell = MDCard(padding=_DP10, radius=[12], md_bg_color=color, size_hint=(None, None), width=_DP110, height=_DP96, ripple_behavior=True)
+            cell_layout = MDBoxLayout(orientation="vertical", spacing=_DP2)
             
-            # Центрируем текст
-            label_container = AnchorLayout(anchor_x="center", anchor_y="center", size_hint_y=None, height="36dp")
-            text_label = MDLabel(text=label, halign="center", theme_text_color="Primary", font_size="13sp", size_hint=(1, None), height="36dp")
-            text_label.bind(width=lambda inst, val: setattr(inst, "text_size", (val, None)))
-            label_container.add_widget(text_label)
-            cell_layout.add_widget(label_container)
+            # Иконка центрируется pos_hint'ом, подпись — собственным halign:
+            # по AnchorLayout-обёртке на каждую не нужно
+            icon_btn = MDIconButton(icon=icon_name, icon_size=_SP32, disabled=True, theme_icon_color="Custom", icon_color=(0.3, 0.3, 0.3, 1), pos_hint={"center_x": 0.5})
+            cell_layout.add_widget(icon_btn)
+
+            text_label = MDLabel(text=label, halign="center", theme_text_color="Primary", font_size=_SP13, size_hint=(1, None), height=_DP36)
+            text_label.bind(width=_bind_text_wrap)
+            cell_layout.add_widget(text_label)
             
             cell.add_widget(cell_layout)
-            cell.bind(on_release=lambda x, cat=label: on_category_click(cat))
+            cell.bind(on_release=partial(self._on_category_click, label))
             grid.add_widget(cell)
         
-        grid_container.add_widget(grid)
-        cat_layout.add_widget(grid_container)
+        cat_layout.add_widget(grid)
         cat_card.add_widget(cat_layout)
         root.add_widget(cat_card)
 
         scroll.add_widget(root)
         self.add_widget(scroll)
 
+    # Обработчики трендов/категорий — методы, а не замыкания внутри
+    # _build_ui: они не пересоздаются при каждом перестроении экрана,
+    # а строки/ячейки биндятся через partial вместо lambda на итерацию
+    # Экран поиска к этому моменту гарантированно построен (_go_to
+    # форсирует _ensure_screens), так что страховочная задержка 0.2 с не
+    # нужна: поиск стартует следующим тиком, параллельно анимации перехода
+    def _on_trend_click(self, query_text, *_args):
+        """Запустить поиск по тренду."""
+        self.app._go_to("search")
+        Clock.schedule_once(lambda dt: self._trigger_search(query_text), 0)
+
+    def _on_category_click(self, category_name, *_args):
+        """Запустить поиск по категории."""
+        self.app._go_to("search")
+        Clock.schedule_once(lambda dt: self._trigger_search(category_name), 0)
+
+    def _scroll_trends_up(self, *_args):
+        if self.trend_index > 0:
+            self.trend_index -= 1
+            self._update_trends()
+
+    def _scroll_trends_down(self, *_args):
+        if self.trend_index < len(self.trending_items) - 2:
+            self.trend_index += 1
+            self._update_trends()
+
+    def _update_trends(self, *_args):
+        """Показать два видимых тренда из заранее построенных строк."""
+        self.trend_container.clear_widgets()
+        end = min(self.trend_index + 2, len(self._trend_rows))
+        for i in range(self.trend_index, end):
+            self.trend_container.add_widget(self._trend_rows[i])
+
+    def _build_trend_row(self, item):
+        """Собрать карточку одного тренда (вызывается один раз на элемент)."""
+        row_container = MDCard(
+            padding=_DP10,
+            radius=[8],
+            md_bg_color=(0.98, 0.98, 1, 1),
+            size_hint_y=None,
+            height=_DP82,
+            ripple_behavior=True
+        )
+        row = MDBoxLayout(orientation="vertical", spacing=_DP4)
+
+        top_row = MDBoxLayout(orientation="horizontal", spacing=_DP6, size_hint_y=None, height=_DP20)
+        tag_label = MDLabel(
+            text=item["tag"],
+            theme_text_color="Secondary",
+            size_hint_x=None,
+            width=_DP50,
+            halign="left",
+            font_size=_SP10
+        )
+        top_row.add_widget(tag_label)
+        change_label = MDLabel(
+            text=item["change"],
+            halign="right",
+            theme_text_color="Secondary",
+            font_size=_SP10
+        )
+        top_row.add_widget(change_label)
+        row.add_widget(top_row)
+
+        name_label = MDLabel(
+            text=item["name"],
+            halign="left",
+            valign="top",
+            theme_text_color="Primary",
+            font_size=_SP13,
+            size_hint_y=None,
+            height=_DP52
+        )
+        name_label.bind(width=_bind_text_wrap)
+        row.add_widget(name_label)
+
+        row_container.add_widget(row)
+        row_container.bind(on_release=partial(self._on_trend_click, item["name"]))
+        return row_container
+
 
 class WebViewScreen(Screen):
     """Экран с WebView для отображения статей."""
@@ -671,17 +969,17 @@ class WebViewScreen(Screen):
         self.current_url = None
         self.webview_widget = None
         
-        layout = MDBoxLayout(orientation="vertical", padding="0dp", spacing="0dp")
+        layout = MDBoxLayout(orientation="vertical", padding=_DP0, spacing=_DP0)
         
         # Верхняя панель
-        top_bar = MDBoxLayout(size_hint_y=None, height="56dp", spacing="10dp", padding="12dp")
-        back_button = MDIconButton(icon="arrow-left", icon_size="28sp")
+        top_bar = MDBoxLayout(size_hint_y=None, height=_DP56, spacing=_DP10, padding=_DP12)
+        back_button = MDIconButton(icon="arrow-left", icon_size=_SP28)
         back_button.bind(on_release=lambda *_: self.app.go_back())
         
         title = MDLabel(text="Статья", theme_text_color="Primary", font_style="H6", bold=True)
         
         # Кнопка открыть в браузере
-        browser_button = MDIconButton(icon="web", icon_size="24sp")
+        browser_button = MDIconButton(icon="web", icon_size=_SP24)
         browser_button.bind(on_release=self.open_in_browser)
         
         top_bar.add_widget(back_button)
@@ -712,7 +1010,6 @@ class WebViewScreen(Screen):
     def open_in_browser(self, *args):
         """Открыть в браузере."""
         if self.current_url:
-            import webbrowser
             webbrowser.open(self.current_url)
 
 
@@ -725,28 +1022,33 @@ class ArticleScreen(Screen):
         self.current_article = None
         self.view_mode = "text"  # "text" или "webview"
         self.webview_widget = None
+        # Диалоги факт-чека создаются лениво и живут весь сеанс
+        self._loading_dialog = None
+        self._result_dialog = None
+        # Событие отмены текущего факт-чека (взводится при уходе с экрана)
+        self._fact_cancel = None
         
-        self.layout = MDBoxLayout(orientation="vertical", padding="12dp", spacing="12dp")
+        self.layout = MDBoxLayout(orientation="vertical", padding=_DP12, spacing=_DP12)
 
-        top_bar = MDBoxLayout(size_hint_y=None, height="56dp", spacing="10dp")
-        back_button = MDIconButton(icon="arrow-left", icon_size="28sp")
+        top_bar = MDBoxLayout(size_hint_y=None, height=_DP56, spacing=_DP10)
+        back_button = MDIconButton(icon="arrow-left", icon_size=_SP28)
         back_button.bind(on_release=lambda *_: self.app.go_back())
         title = MDLabel(text="Полный текст", theme_text_color="Primary", font_style="H6")
         
         # Кнопки действий
-        actions_box = MDBoxLayout(orientation="horizontal", size_hint_x=None, width="144dp", spacing="4dp")
+        actions_box = MDBoxLayout(orientation="horizontal", size_hint_x=None, width=_DP144, spacing=_DP4)
         
         # Кнопка переключения режима просмотра
-        self.view_mode_button = MDIconButton(icon="eye-outline", icon_size="24sp")
+        self.view_mode_button = MDIconButton(icon="eye-outline", icon_size=_SP24)
         self._update_view_mode_icon()
         self.view_mode_button.bind(on_release=self.toggle_view_mode)
         actions_box.add_widget(self.view_mode_button)
         
-        browser_button = MDIconButton(icon="web", icon_size="24sp")
+        browser_button = MDIconButton(icon="web", icon_size=_SP24)
         browser_button.bind(on_release=self.open_in_browser)
         actions_box.add_widget(browser_button)
         
-        fact_check_button = MDIconButton(icon="shield-check", icon_size="24sp")
+        fact_check_button = MDIconButton(icon="shield-check", icon_size=_SP24)
         fact_check_button.bind(on_release=self.show_fact_check)
         actions_box.add_widget(fact_check_button)
         
@@ -757,11 +1059,11 @@ class ArticleScreen(Screen):
         # Контейнер для контента (текст или webview)
         self.content_container = MDBoxLayout(orientation="vertical")
 
-        self.text_container = MDBoxLayout(orientation="vertical", spacing="12dp")
+        self.text_container = MDBoxLayout(orientation="vertical", spacing=_DP12)
         self.image = AsyncImage(
             source="",
             size_hint_y=None,
-            height="0dp",
+            height=_DP0,
             allow_stretch=True,
             keep_ratio=True,
         )
@@ -774,6 +1076,19 @@ class ArticleScreen(Screen):
             halign="left",
             size_hint_y=None,
         )
+        # Биндинги ставятся один раз: повторный bind в каждом показе
+        # статьи накапливал дубликаты наблюдателей. Перенос по ширине
+        # дебаунсится: при повороте/ресайзе width меняется на каждый
+        # пиксель, а дорогой пересчёт раскладки нужен один, по заднему
+        # фронту.
+        self.text_label.bind(texture_size=_bind_texture_height)
+        self.text_label.bind(width=self._on_label_width)
+        self._resize_ev = None
+        self._last_applied_width = 0.0
+        # Последний показанный текст/ширина: повторное открытие той же
+        # статьи не должно перезапускать shaping и перенос строк
+        self._last_text = None
+        self._last_width = 0.0
         self.scroll.add_widget(self.text_label)
         self.text_container.add_widget(self.scroll)
         self.content_container.add_widget(self.text_container)
@@ -782,27 +1097,75 @@ class ArticleScreen(Screen):
         layout.add_widget(self.content_container)
         self.add_widget(layout)
 
+    def _on_label_width(self, _inst: object, value: float) -> None:
+        if value == self._last_applied_width:
+            return
+        if self._resize_ev is not None:
+            self._resize_ev.cancel()
+        self._resize_ev = Clock.schedule_once(self._apply_text_size, 0.05)
+
+    def _apply_text_size(self, _dt: float) -> None:
+        self._resize_ev = None
+        width = self.text_label.width
+        if width == self._last_applied_width:
+            return
+        self._last_applied_width = width
+        self.text_label.text_size = (width, None)
+
+    def _is_same_article(self, text: str) -> bool:
+        """Тот же текст при той же ширине — перевёрстывать нечего."""
+        return text == self._last_text and self.text_label.width == self._last_width
+
     def set_article_text(self, text: str, image_url: str = "", _: float = 0) -> None:
-        formatted_text = "\n\n".join(text.split("\n\n"))
-        self.text_label.text = formatted_text
-        self.text_label.font_size = "16sp"
+        if self._is_same_article(text):
+            self._finish_set_article(image_url)
+            return
+        self._last_text = text
+        self._last_width = self.text_label.width
+        self.text_label.text = text
+        self.text_label.font_size = _SP16
         self.text_label.line_height = 1.5
-        self.text_label.bind(
-            texture_size=lambda instance, value: setattr(instance, "height", value[1])
-        )
-        self.text_label.bind(
-            width=lambda instance, value: setattr(instance, "text_size", (value, None))
-        )
+        self._finish_set_article(image_url)
+
+    def set_article_text_prepared(self, text: str, height: float, image_url: str = "", _: float = 0) -> None:
+        """Показать статью, промеренную фоном (_measure_article_height).
+
+        Высота уже известна, поэтому UI-поток не делает синхронный проход
+        shaping/переноса — биндинг texture_size лишь подправит её, когда
+        текстура дорисуется, и продолжит работать при ресайзе.
+        """
+        if self._is_same_article(text):
+            self._finish_set_article(image_url)
+            return
+        self._last_text = text
+        self._last_width = self.text_label.width
+        self.text_label.font_size = _SP16
+        self.text_label.line_height = 1.5
+        self.text_label.height = height
+        self.text_label.text = text
+        self._finish_set_article(image_url)
+
+    def _set_image(self, image_url: str) -> None:
+        """Идемпотентно обновить картинку статьи.
 
+        Каждая запись Kivy-свойства будит наблюдателей (инвалидация layout),
+        поэтому при неизменном URL все три записи пропускаются целиком.
+        """
+        if self.image.source == image_url:
+            return
         if image_url:
             self.image.source = image_url
-            self.image.height = "220dp"
+            self.image.height = _DP220
             self.image.opacity = 1
         else:
             self.image.source = ""
-            self.image.height = "0dp"
+            self.image.height = _DP0
             self.image.opacity = 0
 
+    def _finish_set_article(self, image_url: str) -> None:
+        """Общий хвост показа статьи: картинка, режим и прокрутка к началу."""
+        self._set_image(image_url)
+
         self.view_mode = "text"
         self._update_view_mode_icon()
         self._show_text_view()
@@ -822,56 +1185,76 @@ class ArticleScreen(Screen):
             return
         link = self.current_article.get("link", "")
         if link:
-            import webbrowser
             webbrowser.open(link)
 
+    def _get_loading_dialog(self) -> MDDialog:
+        """Диалог загрузки создаётся один раз и переиспользуется."""
+        if self._loading_dialog is None:
+            self._loading_dialog = MDDialog(
+                title="Проверка фактов",
+                text="Анализирую статью...\n\nЭто может занять несколько секунд.",
+                size_hint=(0.8, None),
+                height=_DP180,
+            )
+        return self._loading_dialog
+
+    def _get_result_dialog(self, text: str) -> MDDialog:
+        """Диалог результата: дерево виджетов строится при первом вызове."""
+        if self._result_dialog is None:
+            self._result_dialog = MDDialog(
+                title="Результат проверки фактов",
+                text=text,
+                size_hint=(0.9, None),
+                buttons=[
+                    MDFlatButton(
+                        text="Закрыть",
+                        on_release=lambda x: self._result_dialog.dismiss()
+                    )
+                ],
+            )
+        else:
+            self._result_dialog.text = text
+        return self._result_dialog
+
     def show_fact_check(self, *args):
         """Показать результат проверки фактов."""
         if not self.current_article:
             toast("Нет статьи для проверки")
             return
-        
+
         # Показываем диалог загрузки
-        loading_dialog = MDDialog(
-            title="Проверка фактов",
-            text="Анализирую статью...\n\nЭто может занять несколько секунд.",
-            size_hint=(0.8, None),
-            height="180dp",
-        )
+        loading_dialog = self._get_loading_dialog()
         loading_dialog.open()
-        
+        cancel = Event()
+        self._fact_cancel = cancel
+
         def do_fact_check(*args):
             try:
                 title = self.current_article.get("title", "")
-                text = self.current_article.get("full_text", "")
-                result = llm_client.fact_check(text, title, timeout=15.0)
-                
+                # Модель всё равно читает только первые 8000 символов —
+                # срез не даёт замыканию воркера удерживать полный текст
+                text = self.current_article.get("full_text", "")[:8000]
+                result = llm_client.fact_check(text, title, timeout=15.0, cancel=cancel)
+                if cancel.is_set():
+                    return
+
                 def show_result(*args):
                     loading_dialog.dismiss()
-                    result_dialog = MDDialog(
-                        title="Результат проверки фактов",
-                        text=result,
-                        size_hint=(0.9, None),
-                        buttons=[
-                            MDFlatButton(
-                                text="Закрыть",
-                                on_release=lambda x: result_dialog.dismiss()
-                            )
-                        ],
-                    )
-                    result_dialog.open()
-                
-                Clock.schedule_once(show_result, 0)
+                    self._get_result_dialog(result).open()
+
+                self.app._post_ui(show_result)
             except Exception as e:
-                err_msg = str(e)[:100]
+                # Форматирование откладываем до показа toast: воркеру
+                # достаточно передать сам объект исключения
+                err = e
 
                 def show_error(*args):
                     loading_dialog.dismiss()
-                    toast(f"Ошибка: {err_msg}")
-                Clock.schedule_once(show_error, 0)
-        
-        # Запускаем в отдельном потоке
-        threading.Thread(target=do_fact_check, daemon=True).start()
+                    toast(f"Ошибка: {str(err)[:100]}")
+                self.app._post_ui(show_error)
+
+        # Запускаем в общем пуле приложения
+        self.app._executor.submit(do_fact_check)
 
     def toggle_view_mode(self, *args):
         """Переключить режим отображения между текстом и WebView."""
@@ -915,6 +1298,41 @@ class ArticleScreen(Screen):
 
 
 class NewsSearchApp(MDApp):
+    def __init__(self, **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        # Общий пул фоновых задач UI (поиск, статьи, данные домашнего
+        # экрана): дешевле и предсказуемее, чем daemon-поток на каждое
+        # действие, и ограничивает пиковое число потоков
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="news-io")
+        # Последние данные домашнего экрана (см. HomeScreen.__init__)
+        self._last_home_data = None
+        self._last_home_ts = 0.0
+        # Загрузка текущей статьи; cancel() снимает ещё не начатую задачу,
+        # а номер поколения отсекает уже запущенные, но устаревшие
+        self._article_future = None
+        self._req_seq = 0
+        # Очередь UI-обновлений из рабочих потоков: один общий триггер
+        # на приложение (тот же приём, что и в SearchScreen) вместо
+        # ClockEvent + замыкания на каждое событие
+        self._ui_pending = deque()
+        self._ui_trig = Clock.create_trigger(self._pump_ui, 0)
+        # Экраны, не нужные для первого кадра, строятся отложенно
+        self._screens_built = False
+        self.search_screen = None
+        self.article_screen = None
+        self.webview_screen = None
+
+    def _post_ui(self, func, *args) -> None:
+        """Выполнить func(*args) на UI-потоке на ближайшем кадре."""
+        self._ui_pending.append((func, args))
+        self._ui_trig()
+
+    def _pump_ui(self, _dt: float) -> None:
+        """Разобрать накопившиеся UI-обновления за один тик Clock."""
+        while self._ui_pending:
+            func, args = self._ui_pending.popleft()
+            func(*args)
+
     def build(self) -> ScreenManager:
         # IMPORTANT:
         # Do not force Window.size on Android/iOS.
@@ -924,22 +1342,30 @@ class NewsSearchApp(MDApp):
             Window.size = (375, 667)
         self.theme_cls.primary_palette = "BlueGray"
 
+        # Ограничиваем загрузчик картинок: пул воркеров для сети и не больше
+        # двух текстур за кадр, чтобы прогрев превью не ронял FPS.
+        Loader.num_workers = 4
+        Loader.max_upload_per_frame = 2
+
+        # Все AsyncImage делят глобальный кэш Kivy; штатные 60 секунд
+        # жизни записи малы для сценария «поискал — почитал — вернулся»,
+        # поэтому продлеваем, чтобы превью не качались и не декодировались
+        # заново при повторном заходе в выдачу. Только timeout: register
+        # перезаписал бы категорию целиком и снёс штатный limit у kv.loader
+        for _cat in ("kv.image", "kv.texture", "kv.loader"):
+            Cache._categories[_cat]["timeout"] = 300
+
         # Navigation layout: toolbar + drawer + screens
         nav_layout = MDNavigationLayout()
 
+        # К первому кадру нужен только домашний экран; остальные дерево
+        # виджетов достраивают после него (см. _ensure_screens/on_start)
         self.screen_manager = ScreenManager()
         self.home_screen = HomeScreen(app=self, name="home")
-        self.search_screen = SearchScreen(app=self, name="search")
-        self.article_screen = ArticleScreen(app=self, name="article")
-        self.webview_screen = WebViewScreen(app=self, name="webview")
-
         self.screen_manager.add_widget(self.home_screen)
-        self.screen_manager.add_widget(self.search_screen)
-        self.screen_manager.add_widget(self.article_screen)
-        self.screen_manager.add_widget(self.webview_screen)
 
         # Toolbar (simple, title centered)
-        toolbar = AnchorLayout(size_hint_y=None, height="56dp")
+        toolbar = AnchorLayout(size_hint_y=None, height=_DP56)
         title_label = MDLabel(text="NewsSearch", theme_text_color="Primary", font_style="H6", halign="center")
         toolbar.add_widget(title_label)
 
@@ -968,20 +1394,20 @@ class NewsSearchApp(MDApp):
         bottom_bar = MDBoxLayout(
             orientation="horizontal",
             size_hint_y=None,
-            height=dp(64),
-            padding=(0, 0, 0, dp(8)),
+            height=_DP64,
+            padding=(0, 0, 0, _DP8),
         )
         bottom_anchor = AnchorLayout(anchor_x="center", anchor_y="center")
         bottom_icons = MDBoxLayout(
             orientation="horizontal",
             size_hint=(None, None),
-            height=dp(48),
-            width=dp(120),
-            spacing=dp(32),
+            height=_DP48,
+            width=_DP120,
+            spacing=_DP32,
         )
-        bottom_home = MDIconButton(icon="home", icon_size="28sp")
+        bottom_home = MDIconButton(icon="home", icon_size=_SP28)
         bottom_home.bind(on_release=lambda *_: self._go_to("home"))
-        bottom_search = MDIconButton(icon="magnify", icon_size="28sp")
+        bottom_search = MDIconButton(icon="magnify", icon_size=_SP28)
         bottom_search.bind(on_release=lambda *_: self._go_to("search"))
         bottom_icons.add_widget(bottom_home)
         bottom_icons.add_widget(bottom_search)
@@ -998,7 +1424,25 @@ class NewsSearchApp(MDApp):
 
         return nav_layout
 
+    def on_start(self) -> None:
+        # Достраиваем тяжёлые экраны сразу после первого кадра, пока
+        # пользователь смотрит на домашний экран
+        Clock.schedule_once(self._ensure_screens, 0.25)
+
+    def _ensure_screens(self, *_args: object) -> None:
+        """Создать экраны поиска/статьи/WebView, если ещё не созданы."""
+        if self._screens_built:
+            return
+        self._screens_built = True
+        self.search_screen = SearchScreen(app=self, name="search")
+        self.article_screen = ArticleScreen(app=self, name="article")
+        self.webview_screen = WebViewScreen(app=self, name="webview")
+        self.screen_manager.add_widget(self.search_screen)
+        self.screen_manager.add_widget(self.article_screen)
+        self.screen_manager.add_widget(self.webview_screen)
+
     def _go_to(self, screen_name: str) -> None:
+        self._ensure_screens()
         try:
             self.drawer.set_state("close")
         except Exception:
@@ -1010,7 +1454,8 @@ class NewsSearchApp(MDApp):
         if not link:
             toast("Ссылка недоступна.")
             return
-        
+
+        self._ensure_screens()
         self.screen_manager.current = "webview"
         self.webview_screen.load_url(link)
 
@@ -1018,18 +1463,37 @@ class NewsSearchApp(MDApp):
         if not link:
             toast("Ссылка недоступна.")
             return
+        self._ensure_screens()
+        # Любая навигация на статью обесценивает прошлую загрузку, даже если
+        # сейчас отработает кэшированная ветка: уже запущенный воркер нельзя
+        # снять cancel()'ом, и без сдвига токена он дорисовал бы свой текст
+        # поверх новой статьи
+        self._req_seq += 1
         payload = self.search_screen.article_payloads.get(link, {})
         
         # Проверяем кэш полного текста
         cached_text = self.search_screen.article_cache.get(link)
         if cached_text and len(cached_text) > 500:  # Полный текст должен быть достаточно длинным
-            print(f"[ARTICLE] Using cached content for: {link[:60]}")
+            log.debug("[ARTICLE] Using cached content for: %s", link[:60])
             image_url = payload.get("image", "")
             self.screen_manager.current = "article"
             self.article_screen.current_article = payload
             self.article_screen.set_article_text(cached_text, image_url=image_url)
             return
-        
+
+        # Холодный старт: текст мог остаться на диске с прошлого сеанса —
+        # одно маленькое чтение вместо HTTP-запроса и разбора HTML
+        disk_article = cache.load_article(link)
+        if disk_article and len(disk_article.get("full_text", "")) > 500:
+            log.debug("[ARTICLE] Using disk-cached content for: %s", link[:60])
+            text = disk_article["full_text"]
+            image_url = disk_article.get("image") or payload.get("image", "")
+            self.search_screen.article_cache[link] = text
+            self.screen_manager.current = "article"
+            self.article_screen.current_article = payload
+            self.article_screen.set_article_text(text, image_url=image_url)
+            return
+
         # Получаем description и full_text
         full_text = payload.get("full_text", "")
         description = payload.get("description", "")
@@ -1051,26 +1515,32 @@ class NewsSearchApp(MDApp):
         self.article_screen.current_article = payload
         self.article_screen.set_article_text(preview_text, image_url=image_url)
         
-        # Запускаем загрузку полного текста в фоне
-        print(f"[ARTICLE] Fetching full content for: {link[:60]}")
-        threading.Thread(target=self._fetch_and_display, args=(link,), daemon=True).start()
+        # Запускаем загрузку полного текста в общем пуле; незапущенную
+        # загрузку предыдущей статьи снимаем с очереди
+        log.debug("[ARTICLE] Fetching full content for: %s", link[:60])
+        if self._article_future is not None:
+            self._article_future.cancel()
+        self._article_future = self._executor.submit(
+            self._fetch_and_display, link, payload, self._req_seq
+        )
 
-    def _fetch_and_display(self, link: str) -> None:
+    def _fetch_and_display(self, link: str, payload: Dict[str, str], req_id: int) -> None:
+        # payload приходит из show_article: поля читаем один раз здесь,
+        # не гоняя повторные обращения через search_screen
+        title = payload.get("title", "")
+        description = payload.get("description", "")
         try:
-            print(f"[FETCH] Starting content fetch for: {link[:60]}")
-            payload = self.search_screen.article_payloads.get(link, {})
-            title = payload.get("title", "")
+            log.debug("[FETCH] Starting content fetch for: %s", link[:60])
             
             # Вызываем fetch_article_content для получения полного текста
             content = fetch_article_content(link, title=title)
             text = content.get("full_text") or ""
             image = content.get("image")
             
-            print(f"[FETCH] Got {len(text)} chars, image: {bool(image)}")
+            log.debug("[FETCH] Got %d chars, image: %s", len(text), bool(image))
             
             # Если текст слишком короткий или это сообщение об ошибке, используем description
-            if not text or len(text) < 200 or "Статья недоступна" in text or "требуется согласие" in text.lower():
-                description = payload.get("description", "")
+            if not text or len(text) < 200 or _BAD_TEXT_RE.search(text[:500]):
                 error_info = text if text else "Не удалось извлечь текст"
                 
                 if description and len(description) > 50:
@@ -1082,32 +1552,28 @@ class NewsSearchApp(MDApp):
                 else:
                     text = f"❌ {error_info}\n\n💡 Попробуйте:\n• Открыть в браузере (кнопка 🌐)\n• Выбрать другую новость"
             else:
-                # Успешно получили полный текст
-                print(f"[FETCH] Successfully fetched full article")
+                # Успешно получили полный текст; нормализуем здесь же,
+                # чтобы UI-поток получил готовую строку
+                text = _normalize_article_text(text)
+                log.debug("[FETCH] Successfully fetched full article")
             
         except Exception as exc:
-            import traceback
             err_msg = str(exc)[:150]
-            print(f"[FETCH] Error: {err_msg}")
-            traceback.print_exc()
-            
+            log.exception("[FETCH] Error: %s", err_msg)
+
             # Формируем информативное сообщение об ошибке
-            payload = self.search_screen.article_payloads.get(link, {})
-            description = payload.get("description", "")
-            title = payload.get("title", "Статья")
-            
-            error_text = f"📰 {title}\n\n"
+            error_text = f"📰 {title or 'Статья'}\n\n"
             if description:
                 error_text += f"{description}\n\n━━━━━━━━━━━━━━━━━\n\n"
             error_text += f"❌ Не удалось загрузить полный текст\n\n"
             error_text += f"Ошибка: {err_msg}\n\n💡 Попробуйте:\n• Открыть в браузере (кнопка 🌐 вверху)\n• Выбрать другую новость из списка"
-            
-            Clock.schedule_once(lambda *_: self.article_screen.set_article_text(error_text, image_url=payload.get("image")), 0)
-            Clock.schedule_once(lambda *_: toast("Не удалось загрузить статью"), 0)
+
+            if req_id != self._req_seq:
+                return
+            self._post_ui(self.article_screen.set_article_text, error_text, payload.get("image"))
+            self._post_ui(toast, "Не удалось загрузить статью")
             return
 
-        payload = self.search_screen.article_payloads.get(link, {})
-        
         # Если картинка пришла новая, используем её
         image_url = image or payload.get("image", "")
         
@@ -1117,12 +1583,43 @@ class NewsSearchApp(MDApp):
             payload["image"] = image
             
         self.search_screen.article_cache[link] = text
-        print(f"[FETCH] Cached and displaying {len(text)} chars")
-        Clock.schedule_once(lambda *_: self.article_screen.set_article_text(text, image_url=image_url), 0)
+        cache.store_article(link, {"full_text": text, "image": image or ""})
+        log.debug("[FETCH] Cached and displaying %d chars", len(text))
+
+        # Пользователь уже открыл другую статью — результат кэширован выше,
+        # но на экран его не выводим, чтобы не мигнуть чужим текстом
+        if req_id != self._req_seq:
+            log.debug("[FETCH] Stale result for %s dropped", link[:60])
+            return
+
+        # Промер текста (shaping + перенос) делаем здесь, в рабочем потоке;
+        # UI-поток получит готовую высоту и не встанет на длинной статье
+        height = None
+        label_width = self.article_screen.text_label.width
+        if label_width > 0:
+            try:
+                height = _measure_article_height(text, label_width)
+            except Exception:
+                log.debug("[FETCH] Background text measure failed", exc_info=True)
+        if height is not None:
+            self._post_ui(self.article_screen.set_article_text_prepared, text, height, image_url)
+        else:
+            self._post_ui(self.article_screen.set_article_text, text, image_url)
 
     def go_back(self) -> None:
+        # Уходим со статьи — её незапущенная загрузка больше не нужна,
+        # а идущий факт-чек не должен дожидаться оставшихся моделей;
+        # сдвиг токена отменяет и уже стартовавший воркер
+        self._req_seq += 1
+        if self._article_future is not None:
+            self._article_future.cancel()
+        if self.article_screen is not None and self.article_screen._fact_cancel is not None:
+            self.article_screen._fact_cancel.set()
         self.screen_manager.current = "search"
 
+    def on_stop(self) -> None:
+        self._executor.shutdown(wait=False)
+
 
 if __name__ == "__main__":
     NewsSearchApp().run()
\ No newline at end of file
@@ -1,9 +1,14 @@
+import json
 import os
-import time
+import re
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 from typing import List
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from functools import lru_cache
 
 try:
     from openai import OpenAI
@@ -22,6 +27,61 @@ except Exception:
     pass
 
 
+# Разделители в ответе модели: один проход скомпилированного regex вместо
+# replace('\n', ',') + split(',') — двух полных копий строки
+_KW_SPLIT_RE = re.compile(r"[,\n;]+")
+
+
+@lru_cache(maxsize=256)
+def _deterministic_fallback(query: str, max_keywords: int) -> tuple:
+    """Варианты запроса без сети: чистая функция, результат кэшируется.
+
+    Возвращает кортеж (hashable и неизменяемый), чтобы lru_cache мог
+    безопасно отдавать один объект всем вызывающим.
+    """
+    q = (query or "").strip()
+    if not q:
+        return ()
+    variants = [q]
+    words = [w for w in q.split() if len(w) > 2]
+    if len(words) >= 2:
+        variants.append(" ".join(words[:2]))
+    if len(words) >= 3:
+        variants.append(" ".join(words[:3]))
+    variants.append(q + " новости")
+    # dict сохраняет порядок вставки, так что setdefault по нижнему
+    # регистру — это дедупликация и сохранение исходного написания разом
+    seen_map = {}
+    for p in variants:
+        seen_map.setdefault(p.lower(), p)
+    return tuple(list(seen_map.values())[:max_keywords])
+
+
+@lru_cache(maxsize=8)
+def _chat_body_template(prompt: str, max_tokens: int, temperature: float) -> bytes:
+    """Неизменная часть тела chat/completions, закодированная один раз.
+
+    При переборе моделей меняется только поле model — многокилобайтный
+    промпт не стоит сериализовать заново на каждую попытку.
+    """
+    return json.dumps(
+        {
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": float(temperature),
+            "max_tokens": int(max_tokens),
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+# Общая сессия: keep-alive соединения к openrouter.ai / duckduckgo.com
+# вместо нового TCP+TLS handshake на каждый факт-чек и подбор синонимов.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+
 class FastLLMClient:
     """Легковесный клиент для LLM операций с факт-чекингом."""
 
@@ -31,7 +91,11 @@ class FastLLMClient:
         self._base_url = base_url
         self._is_openrouter = "openrouter.ai" in str(base_url)
         self._api_key = (api_key or "").strip() or None
-        
+        # Заголовки OpenRouter читаются из окружения один раз: на горячем
+        # HTTP-пути обращения к os.environ не нужны
+        self._referer = os.environ.get("OPENROUTER_HTTP_REFERER", "http://localhost")
+        self._app_title = os.environ.get("OPENROUTER_APP_TITLE", "News Scout")
+
         # If the official SDK is installed we'll use it, otherwise fall back to a
         # minimal HTTP client (OpenAI/OpenRouter-compatible).
         if not self._api_key:
@@ -41,8 +105,8 @@ class FastLLMClient:
             default_headers = None
             if self._is_openrouter:
                 default_headers = {
-                    "HTTP-Referer": os.environ.get("OPENROUTER_HTTP_REFERER", "http://localhost"),
-                    "X-Title": os.environ.get("OPENROUTER_APP_TITLE", "News Scout"),
+                    "HTTP-Referer": self._referer,
+                    "X-Title": self._app_title,
                 }
             self.client = OpenAI(base_url=base_url, api_key=api_key, default_headers=default_headers)
         else:
@@ -58,9 +122,17 @@ class FastLLMClient:
                 "openai/gpt-4o",
             ]
 
+        # Имена моделей нормализуются один раз: список мал и фиксирован,
+        # по попыткам вызова гоняются уже готовые строки
+        self._normalized_models = [self._normalize_model(m) for m in self.models]
+
         self._executor = ThreadPoolExecutor(max_workers=4)
-        self._cache = {}
+        # Ограниченный TTL-кэш вместо безразмерного dict с ручными
+        # (timestamp, value)-парами: память не растёт за долгую сессию,
+        # протухшие записи вытесняются самим cachetools
         self._cache_ttl = int(os.environ.get("LLM_KEYWORDS_CACHE_TTL_S", 60 * 60 * 6))
+        self._cache = TTLCache(maxsize=512, ttl=self._cache_ttl)
+        self._cache_lock = threading.Lock()
 
     def configure(self, api_key: str, base_url: str = None):
         """Настройка API ключа в рантайме."""
@@ -79,12 +151,14 @@ class FastLLMClient:
             default_headers = None
             if self._is_openrouter:
                 default_headers = {
-                    "HTTP-Referer": os.environ.get("OPENROUTER_HTTP_REFERER", "http://localhost"),
-                    "X-Title": os.environ.get("OPENROUTER_APP_TITLE", "News Scout"),
+                    "HTTP-Referer": self._referer,
+                    "X-Title": self._app_title,
                 }
             self.client = OpenAI(base_url=self._base_url, api_key=api_key, default_headers=default_headers)
         else:
             self.client = None
+        # base_url мог смениться — префиксация моделей зависит от него
+        self._normalized_models = [self._normalize_model(m) for m in self.models]
 
 
     def _call_model_http(self, model: str, prompt: str, max_tokens: int, temperature: float) -> str:
@@ -101,19 +175,17 @@ class FastLLMClient:
         if self._is_openrouter:
             headers.update(
                 {
-                    "HTTP-Referer": os.environ.get("OPENROUTER_HTTP_REFERER", "http://localhost"),
-                    "X-Title": os.environ.get("OPENROUTER_APP_TITLE", "News Scout"),
+                    "HTTP-Referer": self._referer,
+                    "X-Title": self._app_title,
                 }
             )
 
-        payload = {
-            "model": self._normalize_model(model),
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": float(temperature),
-            "max_tokens": int(max_tokens),
-        }
+        # Тело без model берётся из кэша, имя модели подклеивается байтами —
+        # requests получает готовый буфер и ничего не сериализует сам
+        template = _chat_body_template(prompt, max_tokens, temperature)
+        body = b'{"model":' + json.dumps(model).encode("utf-8") + b"," + template[1:]
 
-        resp = requests.post(url, headers=headers, json=payload, timeout=(5, 30))
+        resp = _session.post(url, headers=headers, data=body, timeout=(5, 30))
         if not resp.ok:
             # Try to return a useful error message
             try:
@@ -133,18 +205,14 @@ class FastLLMClient:
             raise RuntimeError("LLM HTTP error: empty message")
         return str(message).strip()
 
-    def _is_cache_valid(self, key: str) -> bool:
-        entry = self._cache.get(key)
-        if not entry:
-            return False
-        ts, _ = entry
-        return (time.time() - ts) < self._cache_ttl
-
     def _cache_get(self, key: str):
-        return self._cache.get(key, (None, None))[1]
+        # TTLCache не потокобезопасен, а сюда ходят воркеры пула
+        with self._cache_lock:
+            return self._cache.get(key)
 
     def _cache_set(self, key: str, value: List[str]):
-        self._cache[key] = (time.time(), value)
+        with self._cache_lock:
+            self._cache[key] = value
 
     def _normalize_model(self, model: str) -> str:
         m = (model or "").strip()
@@ -153,8 +221,8 @@ class FastLLMClient:
         return m
 
     def _call_model(self, model: str, prompt: str, max_tokens: int, temperature: float):
+        """Вызвать модель (имя уже нормализовано вызывающей стороной)."""
         if self.client is not None:
-            model = self._normalize_model(model)
             resp = self.client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
@@ -172,28 +240,18 @@ class FastLLMClient:
         """
         if not query:
             return []
-        cache_key = f"kw::{query.strip().lower()}::{max_keywords}"
-        if self._is_cache_valid(cache_key):
-            return self._cache_get(cache_key)
+        q = query.strip()
+        if len(q) < 3:
+            # Одно-двухсимвольный запрос не окупает ни LLM, ни сеть, ни кэш
+            return [q] if q else []
+        cache_key = f"kw::{q.lower()}::{max_keywords}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         # Если нет API ключа, используем детерминированные fallback
         if not self.client:
-            fallback = [query.strip()]
-            words = [w for w in query.split() if len(w) > 2]
-            if len(words) >= 2:
-                fallback.append(" ".join(words[:2]))
-            if len(words) >= 3:
-                fallback.append(" ".join(words[:3]))
-            fallback.append(query + " новости")
-            out = []
-            seen = set()
-            for p in fallback:
-                low = p.lower()
-                if low not in seen:
-                    seen.add(low)
-                    out.append(p)
-                    if len(out) >= max_keywords:
-                        break
+            out = list(_deterministic_fallback(query, max_keywords))
             self._cache_set(cache_key, out)
             return out
 
@@ -201,23 +259,18 @@ class FastLLMClient:
         prompt = f"Подбери до {max_keywords} коротких ключевых фраз на русском для поиска по теме: {query}. Ответ — одна строка через запятую."
 
         # Пробуем модели по порядку с таймаутом
-        for model in self.models:
+        for model in self._normalized_models:
             try:
                 future = self._executor.submit(self._call_model, model, prompt, max_tokens=80, temperature=0.12)
                 text = future.result(timeout=timeout)
                 if not text:
                     continue
                 # Парсим результат в список
-                parts = [p.strip() for p in text.replace('\n', ',').split(',') if p.strip()]
-                out = []
-                seen = set()
+                parts = [p.strip() for p in _KW_SPLIT_RE.split(text) if p.strip()]
+                seen_map = {}
                 for p in parts:
-                    low = p.lower()
-                    if low not in seen:
-                        seen.add(low)
-                        out.append(p)
-                        if len(out) >= max_keywords:
-                            break
+                    seen_map.setdefault(p.lower(), p)
+                out = list(seen_map.values())[:max_keywords]
                 self._cache_set(cache_key, out)
                 return out
             except Exception as e:
@@ -227,20 +280,17 @@ class FastLLMClient:
         try:
             url = "https://duckduckgo.com/ac/"
             params = {'q': query, 'type': 'list'}
-            resp = requests.get(url, params=params, timeout=2.0)
+            resp = _session.get(url, params=params, timeout=2.0)
             if resp.ok:
                 data = resp.json()
                 # Формат: [query, [suggestion1, suggestion2, ...]]
                 if len(data) >= 2 and isinstance(data[1], list):
-                    suggestions = data[1]
-                    out = []
-                    seen = set()
-                    for phrase in suggestions:
-                        if phrase and phrase.lower() != query.lower() and phrase.lower() not in seen:
-                            out.append(phrase)
-                            seen.add(phrase.lower())
-                            if len(out) >= max_keywords:
-                                break
+                    qlow = query.lower()
+                    seen_map = {}
+                    for phrase in data[1]:
+                        if phrase and phrase.lower() != qlow:
+                            seen_map.setdefault(phrase.lower(), phrase)
+                    out = list(seen_map.values())[:max_keywords]
                     if out:
                         self._cache_set(cache_key, out)
                         return out
@@ -248,50 +298,60 @@ class FastLLMClient:
             print(f"DDG suggestions failed: {e}")
 
         # Последний fallback: простые варианты на основе текста
-        fallback = []
-        q = query.strip()
-        if q:
-            fallback.append(q)
-            words = [w for w in q.split() if len(w) > 2]
-            if len(words) >= 2:
-                fallback.append(" ".join(words[:2]))
-            if len(words) >= 3:
-                fallback.append(" ".join(words[:3]))
-            fallback.append(q + " новости")
-            out = []
-            seen = set()
-            for p in fallback:
-                low = p.lower()
-                if low not in seen:
-                    seen.add(low)
-                    out.append(p)
-                    if len(out) >= max_keywords:
-                        break
+        out = list(_deterministic_fallback(query, max_keywords))
+        if out:
             self._cache_set(cache_key, out)
-            return out
-        
-        return []
+        return out
 
-    def fact_check(self, text: str, title: str = "", timeout: float = 12.0) -> str:
-        """Синхронная проверка фактов."""
+    def fact_check(self, text: str, title: str = "", timeout: float = 12.0,
+                   cancel: threading.Event = None) -> str:
+        """Синхронная проверка фактов.
+
+        cancel — необязательный threading.Event: если он взведён (пользователь
+        ушёл с экрана), перебор моделей прекращается и возвращается пустая
+        строка, не дожидаясь оставшихся таймаутов.
+        """
         if not text:
             return "Нет текста для фактчекинга."
         if not self.client:
             return "Фактчекинг недоступен: не настроен API ключ.\n\nУстановите переменную окружения OPENROUTER_API_KEY или OPENAI_API_KEY."
-        
-        prompt = f"Проведи быструю проверку фактов для заголовка: {title}\n\n{text[:8000]}\n\nКратко: укажи 3–5 ключевых утверждений и риск (НИЗКИЙ/СРЕДНИЙ/ВЫСОКИЙ)."
+
+        # В промпт уходят только первые 8000 символов — отпускаем ссылку на
+        # полный текст сразу, а не держим его все 15+ секунд ожидания модели
+        text = text[:8000]
+        prompt = f"Проведи быструю проверку фактов для заголовка: {title}\n\n{text}\n\nКратко: укажи 3–5 ключевых утверждений и риск (НИЗКИЙ/СРЕДНИЙ/ВЫСОКИЙ)."
         last_err = None
-        
-        for model in self.models:
-            try:
-                future = self._executor.submit(self._call_model, model, prompt, 400, 0.2)
-                result = future.result(timeout=timeout)
+
+        # Все модели опрашиваются параллельно, берём первый непустой ответ:
+        # худший случай ограничен одним timeout, а не timeout * len(models)
+        futures = {
+            self._executor.submit(self._call_model, m, prompt, 400, 0.2): m
+            for m in self._normalized_models
+        }
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                if cancel is not None and cancel.is_set():
+                    return ""
+                try:
+                    result = future.result()
+                except Exception as e:
+                    last_err = e
+                    print(f"Fact-check model {futures[future]} failed: {e}")
+                    continue
                 if result:
                     return result
-            except Exception as e:
-                last_err = e
-                print(f"Fact-check model {model} failed: {e}")
-        
+        except FuturesTimeoutError:
+            if last_err is None:
+                last_err = RuntimeError(f"модели не ответили за {timeout:g} с")
+        finally:
+            # Неначатые вызовы снимаем с очереди; уже ушедшие в сеть просто
+            # довисят в своём воркере, их результат никому не нужен
+            for f in futures:
+                f.cancel()
+
+        if cancel is not None and cancel.is_set():
+            return ""
+
         if last_err:
             msg = str(last_err).replace("\n", " ")
             return f"Ошибка фактчекинга: {msg[:180]}"
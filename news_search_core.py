@@ -184,6 +184,16 @@ def decode_google_news_url(url: str) -> str:
     return url
 
 
+# Порог, после которого страница считается "тяжёлой": перед разбором из неё
+# дешёвым regex вырезаются script/style-блоки (на современных страницах это
+# в основном JS-бандлы и JSON), чтобы чистопитоновский html.parser не тратил
+# CPU на разметку, которую мы всё равно выбрасываем
+_BIG_HTML_BYTES = 200_000
+_NOISE_BLOCK_RE = re.compile(
+    r"<(script|style|noscript|svg)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+
+
 def _extract_text_from_html(html: str) -> str | None:
     """Best-effort HTML -> plain text extraction without native deps.
 
@@ -197,6 +207,9 @@ def _extract_text_from_html(html: str) -> str | None:
     if BeautifulSoup is None:
         return None
 
+    if len(html) > _BIG_HTML_BYTES:
+        html = _NOISE_BLOCK_RE.sub("", html)
+
     soup = BeautifulSoup(html, "html.parser")
 
     # Drop obvious boilerplate/noise